@@ -7,14 +7,233 @@ Handles key term extraction, clause function analysis, and legal pattern recogni
 """
 
 import re
+import copy
+import bisect
+import heapq
+import hashlib
 import logging
-from typing import List, Dict, Set, Tuple, Optional
-from collections import Counter
+import functools
+import threading
+from types import MappingProxyType
+from typing import List, Dict, Set, Tuple, Optional, Callable
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 
+# Term extraction patterns keyed by "<category>_<name>" (tec/fin/tmp). Each
+# pattern is scanned on its own, in listed order, so overlapping terms from
+# different patterns ("upon payment", "payment") are all reported.
+_TERM_PATTERNS: Dict[str, str] = {
+    # Financial and monetary terms
+    'fin_dollar': r'\$[\d,]+(?:\.\d{2})?',  # Dollar amounts
+    'fin_rate': r'\b\d+(?:\.\d{2})?%',  # Interest rates/percentages
+    'fin_keyword': r'\b(?:payment|fee|cost|penalty|refund)\b',  # Financial keywords
+    'fin_payment_terms': r'\b\d+\s*days?\s*(?:after|before|from)\b',  # Payment terms
+    # Common temporal expressions in contracts
+    'tmp_duration': r'\b\d+\s*(?:day|week|month|year)s?\b',
+    'tmp_immediately': r'\bimmediately\b',
+    'tmp_promptly': r'\bpromptly\b',
+    'tmp_upon': r'\bupon\s+\w+\b',
+    'tmp_within': r'\bwithin\s+\d+\s*\w+\b',
+    'tmp_no_later_than': r'\bno\s+later\s+than\b',
+    # Technical terms (only reported for TEC clauses)
+    'tec_percent': r'\b\d+%',  # Percentages (SLAs)
+    'tec_hours': r'\b\d+\s*hours?\b',  # Time specifications
+    'tec_days': r'\b\d+\s*days?\b',
+    'tec_uptime': r'\buptime\b',
+    'tec_performance': r'\bperformance\b',
+    'tec_deliverable': r'\bdeliverable\b',
+}
+
+# Word tokens used for term frequency counting
+_WORD_RE = re.compile(r'\w+')
+
+# Joins clauses for batch scanning; no term pattern can match a NUL character
+_BATCH_SEPARATOR = '\x00'
+
+# Helper patterns for text cleanup and obligation/temporal normalization
+_WS_RE = re.compile(r'\s+')
+_CLEAN_TRANS = str.maketrans({
+    '\u201c': '"', '\u201d': '"',  # Curly double quotes
+    '\u2018': "'", '\u2019': "'"   # Curly single quotes
+})
+_ACTION_RE = re.compile(r'\b(?:shall|must|will|agrees? to|undertakes? to)\s+(\w+)', re.IGNORECASE)
+_TEMPORAL_NORM_RE = re.compile(r'(\d+)\s*(\w+)')
+_PERIOD_RE = re.compile(r'\.')
+
+# Consequence indicators following a condition, tried in order
+_CONSEQUENCE_PATTERNS: Tuple[re.Pattern, ...] = tuple(
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'then\s+(.+?)(?:\.|;|,)',
+        r',\s*(.+?)(?:\.|;)',
+        r'\s+(.+?)(?:\.|;)'
+    )
+)
+
+
+def _fuse_patterns(patterns: Dict[str, str]) -> re.Pattern:
+    """Fuse named patterns into one alternation; ``lastgroup`` names the hit."""
+    return re.compile(
+        "|".join(f"(?P<{name}>{src})" for name, src in patterns.items()),
+        re.IGNORECASE
+    )
+
+
+# Legal vocabulary for term extraction
+_LEGAL_VOCABULARY: Dict[str, Tuple[str, ...]] = {
+    'words': (
+        'liability', 'indemnification', 'breach', 'default', 'termination',
+        'jurisdiction', 'governing', 'arbitration', 'mediation', 'damages',
+        'warranty', 'representation', 'covenant', 'obligation', 'remedy'
+    ),
+    'phrases': (
+        'governing law', 'dispute resolution', 'force majeure', 'intellectual property',
+        'confidential information', 'trade secrets', 'limitation of liability',
+        'liquidated damages', 'specific performance', 'injunctive relief'
+    ),
+    'high_value': frozenset((
+        'indemnification', 'limitation of liability', 'intellectual property',
+        'termination', 'breach', 'governing law', 'dispute resolution'
+    ))
+}
+
+# Words that earn a term a relevance bonus under a given context tag
+_CONTEXT_BONUS_WORDS: Dict[str, Tuple[str, ...]] = {
+    'FIN': ('payment', 'fee', 'cost'),
+    'LEG': ('liability', 'breach', 'law')
+}
+
+# Pre-lowercased vocabulary lookups for term extraction
+_LEGAL_WORDS_LC = frozenset(word.lower() for word in _LEGAL_VOCABULARY['words'])
+_LEGAL_PHRASES_LC = tuple((phrase, phrase.lower()) for phrase in _LEGAL_VOCABULARY['phrases'])
+
+# Action detection patterns
+_ACTION_PATTERNS: Dict[str, re.Pattern] = {
+    name: re.compile(src, re.IGNORECASE) for name, src in {
+        'obligation': r'\b(?:shall|must|agrees? to|undertakes? to|is required to)\b',
+        'permission': r'\b(?:may|is permitted to|is entitled to|has the right to)\b',
+        'prohibition': r'\b(?:shall not|must not|may not|is prohibited from)\b'
+    }.items()
+}
+
+# Obligation detection patterns
+_OBLIGATION_PATTERNS: Dict[str, re.Pattern] = {
+    name: re.compile(src, re.IGNORECASE) for name, src in {
+        'payment_obligation': r'\b(?:shall pay|must pay|payment.{0,20}due)\b',
+        'delivery_obligation': r'\b(?:shall deliver|must provide|delivery.{0,20}required)\b',
+        'performance_obligation': r'\b(?:shall perform|must complete|performance.{0,20}required)\b',
+        'notice_obligation': r'\b(?:shall notify|must inform|notice.{0,20}required)\b'
+    }.items()
+}
+
+# Conditional statement patterns
+_CONDITIONAL_PATTERNS: Tuple[re.Pattern, ...] = tuple(
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'\bif\b(.+?)\bthen\b',
+        r'\bunless\b(.+?)(?:,|\.|;)',
+        r'\bprovided that\b(.+?)(?:,|\.|;)',
+        r'\bsubject to\b(.+?)(?:,|\.|;)'
+    )
+)
+
+# Temporal element patterns
+_TEMPORAL_PATTERNS: Dict[str, re.Pattern] = {
+    name: re.compile(src, re.IGNORECASE) for name, src in {
+        'deadline': r'\b(?:by|before|no later than)\s+[^,\.]+',
+        'duration': r'\b\d+\s*(?:day|week|month|year)s?\b',
+        'frequency': r'\b(?:daily|weekly|monthly|annually|quarterly)\b',
+        'immediacy': r'\b(?:immediately|promptly|forthwith|without delay)\b'
+    }.items()
+}
+
+# Compiled term patterns as (category, pattern) pairs, in listed order
+_TERM_SCANNERS: Tuple[Tuple[str, re.Pattern], ...] = tuple(
+    (name.split('_', 1)[0], re.compile(src, re.IGNORECASE))
+    for name, src in _TERM_PATTERNS.items()
+)
+
+# Fused single-pass scanner over the obligation patterns
+_OBLIGATION_SCANNER = _fuse_patterns(
+    {name: pattern.pattern for name, pattern in _OBLIGATION_PATTERNS.items()}
+)
+
+# Indicator phrases for clause function identification
+_FUNCTION_INDICATORS: Dict[str, Tuple[str, ...]] = {
+    'define_obligations': ('shall', 'must', 'agrees to', 'undertakes to'),
+    'establish_rights': ('entitled to', 'right to', 'may', 'permitted to'),
+    'set_conditions': ('if', 'unless', 'provided that', 'subject to'),
+    'specify_procedures': ('procedure', 'process', 'method', 'manner'),
+    'allocate_risks': ('liable', 'responsible', 'assumes', 'bears'),
+    'define_terms': ('means', 'defined as', 'refers to', 'includes'),
+    'establish_timelines': ('within', 'by', 'deadline', 'schedule'),
+    'govern_payments': ('payment', 'invoice', 'fee', 'cost', 'penalty')
+}
+
+# Flattened (function, indicator) pairs so clause function scoring is one loop
+_INDICATOR_PAIRS: Tuple[Tuple[str, str], ...] = tuple(
+    (function, indicator)
+    for function, indicators in _FUNCTION_INDICATORS.items()
+    for indicator in indicators
+)
+
+# Keyword -> party lookup for obligation assignment
+_PARTY_LOOKUP: Dict[str, str] = {
+    keyword: party
+    for party, keywords in {
+        'Provider': ('provider', 'contractor', 'vendor', 'supplier'),
+        'Client': ('client', 'customer', 'buyer', 'purchaser'),
+        'Both': ('parties', 'each party', 'both')
+    }.items()
+    for keyword in keywords
+}
+
+
+# Analyzer results keyed by clause text digest; boilerplate clauses repeat often
+_RESULT_CACHE_SIZE = 4096
+_MISSING = object()
+
+
+def _cached_by_text(method: Callable) -> Callable:
+    """
+    Memoize an analyzer method in an LRU keyed by a digest of the clause text
+    and the remaining arguments. Results are deep-copied on the way out so
+    callers may still mutate what they get back.
+    """
+    cache: OrderedDict = OrderedDict()
+    lock = threading.Lock()
+    
+    @functools.wraps(method)
+    def wrapper(self, text: str, *args, **kwargs):
+        key = (
+            hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest(),
+            tuple(tuple(arg) if isinstance(arg, list) else arg for arg in args),
+            tuple(sorted(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in kwargs.items()
+            ))
+        )
+        with lock:
+            result = cache.get(key, _MISSING)
+            if result is not _MISSING:
+                cache.move_to_end(key)
+        
+        if result is not _MISSING:
+            return copy.deepcopy(result)
+        
+        result = method(self, text, *args, **kwargs)
+        
+        with lock:
+            cache[key] = result
+            if len(cache) > _RESULT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return copy.deepcopy(result)
+    
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
 @dataclass
 class LegalEntity:
     """Represents a legal entity or concept extracted from text."""
@@ -42,14 +261,18 @@ class LegalNLPProcessor:
     
     def __init__(self):
         """Initialize the legal NLP processor with patterns and vocabularies."""
-        self.legal_vocabulary = self._build_legal_vocabulary()
-        self.action_patterns = self._build_action_patterns()
-        self.obligation_patterns = self._build_obligation_patterns()
-        self.conditional_patterns = self._build_conditional_patterns()
-        self.temporal_patterns = self._build_temporal_patterns()
+        # Fixed vocabularies and compiled patterns are shared module constants,
+        # exposed as read-only views so no instance can alter them for the others
+        self.legal_vocabulary = MappingProxyType(_LEGAL_VOCABULARY)
+        self.action_patterns = MappingProxyType(_ACTION_PATTERNS)
+        self.obligation_patterns = MappingProxyType(_OBLIGATION_PATTERNS)
+        self.conditional_patterns = _CONDITIONAL_PATTERNS
+        self.temporal_patterns = MappingProxyType(_TEMPORAL_PATTERNS)
+        self.function_indicators = MappingProxyType(_FUNCTION_INDICATORS)
         
         logger.info("LegalNLPProcessor initialized")
     
+    @_cached_by_text
     def extract_key_terms(self, text: str, context_tags: List[str] = None) -> List[str]:
         """
         Extract key legal and technical terms from clause text.
@@ -64,22 +287,60 @@ class LegalNLPProcessor:
         # Normalize text
         text_clean = self._clean_text(text)
         
-        # Extract different types of terms
-        legal_terms = self._extract_legal_terms(text_clean)
-        technical_terms = self._extract_technical_terms(text_clean, context_tags)
-        financial_terms = self._extract_financial_terms(text_clean)
-        temporal_terms = self._extract_temporal_terms(text_clean)
+        return self._rank_key_terms(
+            text_clean.lower(), self._extract_pattern_terms(text_clean), context_tags
+        )
+    
+    def extract_key_terms_batch(
+        self,
+        texts: List[str],
+        context_tags: Optional[List[Optional[List[str]]]] = None
+    ) -> List[List[str]]:
+        """
+        Extract key terms for many clauses at once.
         
-        # Combine and rank terms
-        all_terms = legal_terms + technical_terms + financial_terms + temporal_terms
+        The cleaned texts are joined with a separator that no term pattern can
+        match across, lowercased with one call and scanned with one pass per
+        term pattern; hits are then assigned back to their clause by offset.
         
-        # Remove duplicates and rank by importance
-        term_scores = self._score_terms(all_terms, text_clean, context_tags)
+        Args:
+            texts: Clause contents to analyze
+            context_tags: Context tags per clause (defaults to none for every clause)
+            
+        Returns:
+            Key terms per clause, in input order, as extract_key_terms would return
+        """
+        if context_tags is None:
+            context_tags = [None] * len(texts)
+        elif len(context_tags) != len(texts):
+            raise ValueError("context_tags must have one entry per text")
+        
+        cleaned = [self._clean_text(text) for text in texts]
+        if any(_BATCH_SEPARATOR in text for text in cleaned):
+            return [self.extract_key_terms(text, tags) for text, tags in zip(texts, context_tags)]
+        
+        joined = _BATCH_SEPARATOR.join(cleaned)
+        lowered = joined.lower().split(_BATCH_SEPARATOR)
+        
+        # Start offset of every clause inside the joined text
+        starts = []
+        offset = 0
+        for text in cleaned:
+            starts.append(offset)
+            offset += len(text) + len(_BATCH_SEPARATOR)
+        
+        pattern_terms = [{'tec': [], 'fin': [], 'tmp': []} for _ in cleaned]
+        for category, pattern in _TERM_SCANNERS:
+            for match in pattern.finditer(joined):
+                index = bisect.bisect_right(starts, match.start()) - 1
+                pattern_terms[index][category].append(match.group(0))
         
-        # Return top terms
-        ranked_terms = sorted(term_scores.items(), key=lambda x: x[1], reverse=True)
-        return [term for term, score in ranked_terms[:10]]
+        return [
+            self._rank_key_terms(text_lc, terms, tags)
+            for text_lc, terms, tags in zip(lowered, pattern_terms, context_tags)
+        ]
     
+    @_cached_by_text
     def analyze_clause_function(self, text: str) -> str:
         """
         Analyze and describe the primary function of a clause.
@@ -97,6 +358,7 @@ class LegalNLPProcessor:
         else:
             return f"Appears to {function.primary_function}. Additional analysis may be needed for clarity."
     
+    @_cached_by_text
     def extract_obligations(self, text: str) -> List[Dict[str, str]]:
         """
         Extract obligations and responsibilities from clause text.
@@ -109,19 +371,21 @@ class LegalNLPProcessor:
         """
         obligations = []
         
-        for pattern_name, pattern in self.obligation_patterns.items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                obligation = {
-                    'type': pattern_name,
-                    'text': match.group(0),
-                    'party': self._identify_obligated_party(match.group(0)),
-                    'action': self._extract_action(match.group(0))
-                }
-                obligations.append(obligation)
+        # The fused scanner yields non-overlapping spans, so a phrase covered
+        # by an earlier obligation match is never reported a second time
+        for match in _OBLIGATION_SCANNER.finditer(text):
+            obligation_text = match.group(0)
+            obligation = {
+                'type': match.lastgroup,
+                'text': obligation_text,
+                'party': self._identify_obligated_party(obligation_text),
+                'action': self._extract_action(obligation_text)
+            }
+            obligations.append(obligation)
         
         return obligations
     
+    @_cached_by_text
     def extract_conditions(self, text: str) -> List[Dict[str, str]]:
         """
         Extract conditional statements and trigger conditions.
@@ -135,8 +399,7 @@ class LegalNLPProcessor:
         conditions = []
         
         for pattern in self.conditional_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+            for match in pattern.finditer(text):
                 condition = {
                     'trigger': match.group(1) if match.groups() else match.group(0),
                     'consequence': self._extract_consequence(match.group(0), text),
@@ -146,6 +409,7 @@ class LegalNLPProcessor:
         
         return conditions
     
+    @_cached_by_text
     def extract_temporal_elements(self, text: str) -> List[Dict[str, str]]:
         """
         Extract time-related elements (deadlines, durations, schedules).
@@ -158,14 +422,25 @@ class LegalNLPProcessor:
         """
         temporal_elements = []
         
-        for pattern_name, pattern in self.temporal_patterns.items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        # Scan each pattern on its own so results keep the per-type ordering
+        matches_by_type = {
+            name: list(pattern.finditer(text)) for name, pattern in self.temporal_patterns.items()
+        }
+        
+        if not any(matches_by_type.values()):
+            return temporal_elements
+        
+        # Sentence start offsets, computed once for all context lookups
+        sentence_starts = [0]
+        sentence_starts.extend(match.end() for match in _PERIOD_RE.finditer(text))
+        
+        for pattern_name, matches in matches_by_type.items():
             for match in matches:
                 element = {
                     'type': pattern_name,
                     'text': match.group(0),
                     'value': self._normalize_temporal_value(match.group(0)),
-                    'context': self._extract_temporal_context(match.group(0), text)
+                    'context': self._extract_temporal_context(match.start(), text, sentence_starts)
                 }
                 temporal_elements.append(element)
         
@@ -173,98 +448,77 @@ class LegalNLPProcessor:
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text for processing."""
-        # Remove extra whitespace
-        text = re.sub(r'\\s+', ' ', text)
-        # Remove line breaks
-        text = text.replace('\\n', ' ').replace('\\r', ' ')
-        # Normalize quotes
-        text = text.replace('"', '"').replace('"', '"')
-        return text.strip()
+        # Normalize typographic quotes, then collapse whitespace including line breaks
+        return _WS_RE.sub(' ', text.translate(_CLEAN_TRANS)).strip()
     
-    def _extract_legal_terms(self, text: str) -> List[str]:
-        """Extract legal terminology from text."""
+    def _rank_key_terms(
+        self,
+        text_lc: str,
+        pattern_terms: Dict[str, List[str]],
+        context_tags: List[str] = None
+    ) -> List[str]:
+        """Combine legal and pattern terms and return the ten highest scoring."""
+        legal_terms = self._extract_legal_terms(text_lc)
+        technical_terms = pattern_terms['tec'] if context_tags and 'TEC' in context_tags else []
+        
+        # Combine terms, dropping duplicates (order preserved) before scoring
+        all_terms = list(dict.fromkeys(
+            legal_terms + technical_terms + pattern_terms['fin'] + pattern_terms['tmp']
+        ))
+        
+        # Rank by importance
+        term_scores = self._score_terms(all_terms, text_lc, context_tags)
+        
+        # Return top terms
+        ranked_terms = heapq.nlargest(10, term_scores.items(), key=lambda x: x[1])
+        return [term for term, score in ranked_terms]
+    
+    def _extract_legal_terms(self, text_lc: str) -> List[str]:
+        """Extract legal terminology from lowercased text."""
         legal_terms = []
         
         # Multi-word legal phrases
-        for phrase in self.legal_vocabulary['phrases']:
-            if phrase.lower() in text.lower():
+        for phrase, phrase_lower in _LEGAL_PHRASES_LC:
+            if phrase_lower in text_lc:
                 legal_terms.append(phrase)
         
         # Single legal words
-        words = text.lower().split()
-        for word in words:
-            if word in self.legal_vocabulary['words']:
-                legal_terms.append(word)
+        legal_terms.extend(word for word in text_lc.split() if word in _LEGAL_WORDS_LC)
         
         return legal_terms
     
-    def _extract_technical_terms(self, text: str, context_tags: List[str] = None) -> List[str]:
-        """Extract technical terms based on context."""
-        technical_terms = []
-        
-        # Technical patterns based on context
-        if context_tags and 'TEC' in context_tags:
-            tech_patterns = [
-                r'\\b\\d+%\\b',  # Percentages (SLAs)
-                r'\\b\\d+\\s*hours?\\b',  # Time specifications
-                r'\\b\\d+\\s*days?\\b',
-                r'\\buptime\\b',
-                r'\\bperformance\\b',
-                r'\\bdeliverable\\b'
-            ]
-            
-            for pattern in tech_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                technical_terms.extend(matches)
-        
-        return technical_terms
-    
-    def _extract_financial_terms(self, text: str) -> List[str]:
-        """Extract financial and monetary terms."""
-        financial_patterns = [
-            r'\\$[\\d,]+(?:\\.\\d{2})?',  # Dollar amounts
-            r'\\b\\d+(?:\\.\\d{2})?%\\b',  # Interest rates/percentages
-            r'\\b(?:payment|fee|cost|penalty|refund)\\b',  # Financial keywords
-            r'\\b\\d+\\s*days?\\s*(?:after|before|from)\\b'  # Payment terms
-        ]
+    def _extract_pattern_terms(self, text: str) -> Dict[str, List[str]]:
+        """Extract technical, financial and temporal terms, grouped by category."""
+        terms = {'tec': [], 'fin': [], 'tmp': []}
         
-        financial_terms = []
-        for pattern in financial_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            financial_terms.extend(matches)
+        for category, pattern in _TERM_SCANNERS:
+            terms[category].extend(pattern.findall(text))
         
-        return financial_terms
+        return terms
     
-    def _extract_temporal_terms(self, text: str) -> List[str]:
-        """Extract time-related terms and expressions."""
-        temporal_terms = []
-        
-        # Common temporal expressions in contracts
-        temporal_expressions = [
-            r'\\b\\d+\\s*(?:day|week|month|year)s?\\b',
-            r'\\bimmediately\\b',
-            r'\\bpromptly\\b',
-            r'\\bupon\\s+\\w+\\b',
-            r'\\bwithin\\s+\\d+\\s*\\w+\\b',
-            r'\\bno\\s+later\\s+than\\b'
-        ]
+    def _score_terms(self, terms: List[str], text_lc: str, context_tags: List[str] = None) -> Dict[str, float]:
+        """Score terms by importance and relevance against lowercased text."""
+        term_scores = {}
         
-        for pattern in temporal_expressions:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            temporal_terms.extend(matches)
+        # One tokenization pass serves every single-word term; multi-word and
+        # symbolic terms ($, %, spaces) still fall back to a substring count
+        word_counts = Counter(_WORD_RE.findall(text_lc))
         
-        return temporal_terms
-    
-    def _score_terms(self, terms: List[str], text: str, context_tags: List[str] = None) -> Dict[str, float]:
-        """Score terms by importance and relevance."""
-        term_scores = {}
-        text_lower = text.lower()
+        # Resolve per-call lookups once instead of per term
+        high_value = _LEGAL_VOCABULARY['high_value']
+        context_bonus_words = [
+            _CONTEXT_BONUS_WORDS[tag] for tag in context_tags or () if tag in _CONTEXT_BONUS_WORDS
+        ]
         
         for term in terms:
             score = 1.0  # Base score
+            term_lower = term.lower()
             
             # Frequency scoring
-            frequency = text_lower.count(term.lower())
+            if _WORD_RE.fullmatch(term_lower):
+                frequency = word_counts[term_lower]
+            else:
+                frequency = text_lc.count(term_lower)
             score += frequency * 0.5
             
             # Length scoring (longer terms often more specific)
@@ -272,18 +526,13 @@ class LegalNLPProcessor:
                 score += 0.3
             
             # Legal vocabulary bonus
-            if term.lower() in self.legal_vocabulary['high_value']:
+            if term_lower in high_value:
                 score += 1.0
             
-            # Context relevance
-            if context_tags:
-                for tag in context_tags:
-                    if tag in ['FIN'] and any(fin_word in term.lower() 
-                                            for fin_word in ['payment', 'fee', 'cost']):
-                        score += 0.5
-                    elif tag == 'LEG' and any(leg_word in term.lower() 
-                                            for leg_word in ['liability', 'breach', 'law']):
-                        score += 0.5
+            # Context relevance: one bonus per matching context tag
+            for bonus_words in context_bonus_words:
+                if any(word in term_lower for word in bonus_words):
+                    score += 0.5
             
             term_scores[term] = score
         
@@ -291,30 +540,25 @@ class LegalNLPProcessor:
     
     def _identify_clause_function(self, text: str) -> ClauseFunction:
         """Identify the primary function of a clause."""
-        function_indicators = {
-            'define_obligations': ['shall', 'must', 'agrees to', 'undertakes to'],
-            'establish_rights': ['entitled to', 'right to', 'may', 'permitted to'],
-            'set_conditions': ['if', 'unless', 'provided that', 'subject to'],
-            'specify_procedures': ['procedure', 'process', 'method', 'manner'],
-            'allocate_risks': ['liable', 'responsible', 'assumes', 'bears'],
-            'define_terms': ['means', 'defined as', 'refers to', 'includes'],
-            'establish_timelines': ['within', 'by', 'deadline', 'schedule'],
-            'govern_payments': ['payment', 'invoice', 'fee', 'cost', 'penalty']
-        }
-        
-        scores = {}
+        scores = dict.fromkeys(_FUNCTION_INDICATORS, 0)
         indicators_found = []
         
         text_lower = text.lower()
-        for function, indicators in function_indicators.items():
-            score = 0
-            for indicator in indicators:
-                if indicator in text_lower:
-                    score += 1
-                    indicators_found.append(indicator)
-            scores[function] = score
-        
-        if not scores or max(scores.values()) == 0:
+        for function, indicator in _INDICATOR_PAIRS:
+            if indicator in text_lower:
+                scores[function] += 1
+                indicators_found.append(indicator)
+        
+        # Track the best-scoring function and every matched function in one pass;
+        # strict ">" keeps the first function on ties, as max() did
+        primary_function, best_score, matched_functions = None, 0, []
+        for function, score in scores.items():
+            if score > 0:
+                matched_functions.append(function)
+                if score > best_score:
+                    primary_function, best_score = function, score
+        
+        if primary_function is None:
             return ClauseFunction(
                 primary_function="establish contractual terms",
                 secondary_functions=[],
@@ -322,12 +566,10 @@ class LegalNLPProcessor:
                 indicators=[]
             )
         
-        primary_function = max(scores, key=scores.get)
-        confidence = min(scores[primary_function] / 3.0, 1.0)  # Normalize confidence
+        confidence = min(best_score / 3.0, 1.0)  # Normalize confidence
         
         # Get secondary functions
-        secondary_functions = [func for func, score in scores.items() 
-                             if func != primary_function and score > 0]
+        secondary_functions = [func for func in matched_functions if func != primary_function]
         
         return ClauseFunction(
             primary_function=primary_function.replace('_', ' '),
@@ -352,37 +594,27 @@ class LegalNLPProcessor:
         return descriptions.get(function.primary_function, "This clause establishes contractual provisions.")
     
     def _identify_obligated_party(self, obligation_text: str) -> str:
-        """Identify which party has the obligation."""
-        party_indicators = {
-            'Provider': ['provider', 'contractor', 'vendor', 'supplier'],
-            'Client': ['client', 'customer', 'buyer', 'purchaser'],
-            'Both': ['parties', 'each party', 'both']
-        }
-        
-        text_lower = obligation_text.lower()
-        for party, indicators in party_indicators.items():
-            if any(indicator in text_lower for indicator in indicators):
+        """Identify which party has the obligation (first party keyword wins)."""
+        previous = ''
+        for token in _WORD_RE.findall(obligation_text.lower()):
+            # Check the two-word window first so "each party" is recognized
+            party = _PARTY_LOOKUP.get(f"{previous} {token}") or _PARTY_LOOKUP.get(token)
+            if party:
                 return party
+            previous = token
         
         return "Unspecified"
     
     def _extract_action(self, obligation_text: str) -> str:
         """Extract the action/verb from an obligation."""
-        action_verbs = re.findall(r'\\b(?:shall|must|will|agrees? to|undertakes? to)\\s+(\\w+)', 
-                                 obligation_text, re.IGNORECASE)
-        return action_verbs[0] if action_verbs else "perform"
+        match = _ACTION_RE.search(obligation_text)
+        return match.group(1) if match else "perform"
     
     def _extract_consequence(self, condition_text: str, full_text: str) -> str:
         """Extract the consequence of a conditional statement."""
         # Look for consequence indicators after the condition
-        consequence_patterns = [
-            r'then\\s+(.+?)(?:\\.|;|,)',
-            r',\\s*(.+?)(?:\\.|;)',
-            r'\\s+(.+?)(?:\\.|;)'
-        ]
-        
-        for pattern in consequence_patterns:
-            match = re.search(pattern, condition_text, re.IGNORECASE)
+        for pattern in _CONSEQUENCE_PATTERNS:
+            match = pattern.search(condition_text)
             if match:
                 return match.group(1).strip()
         
@@ -402,7 +634,7 @@ class LegalNLPProcessor:
     def _normalize_temporal_value(self, temporal_text: str) -> str:
         """Normalize temporal expressions to standard format."""
         # Extract number and unit
-        match = re.search(r'(\\d+)\\s*(\\w+)', temporal_text)
+        match = _TEMPORAL_NORM_RE.search(temporal_text)
         if match:
             number, unit = match.groups()
             # Normalize unit
@@ -417,68 +649,12 @@ class LegalNLPProcessor:
         
         return temporal_text
     
-    def _extract_temporal_context(self, temporal_text: str, full_text: str) -> str:
-        """Extract context around temporal expressions."""
-        # Find the sentence containing the temporal expression
-        sentences = full_text.split('.')
-        for sentence in sentences:
-            if temporal_text in sentence:
-                return sentence.strip()
-        return "context not found"
-    
-    def _build_legal_vocabulary(self) -> Dict[str, List[str]]:
-        """Build legal vocabulary for term extraction."""
-        return {
-            'words': [
-                'liability', 'indemnification', 'breach', 'default', 'termination',
-                'jurisdiction', 'governing', 'arbitration', 'mediation', 'damages',
-                'warranty', 'representation', 'covenant', 'obligation', 'remedy'
-            ],
-            'phrases': [
-                'governing law', 'dispute resolution', 'force majeure', 'intellectual property',
-                'confidential information', 'trade secrets', 'limitation of liability',
-                'liquidated damages', 'specific performance', 'injunctive relief'
-            ],
-            'high_value': [
-                'indemnification', 'limitation of liability', 'intellectual property',
-                'termination', 'breach', 'governing law', 'dispute resolution'
-            ]
-        }
-    
-    def _build_action_patterns(self) -> Dict[str, str]:
-        """Build patterns for action detection."""
-        return {
-            'obligation': r'\\b(?:shall|must|agrees? to|undertakes? to|is required to)\\b',
-            'permission': r'\\b(?:may|is permitted to|is entitled to|has the right to)\\b',
-            'prohibition': r'\\b(?:shall not|must not|may not|is prohibited from)\\b'
-        }
-    
-    def _build_obligation_patterns(self) -> Dict[str, str]:
-        """Build patterns for obligation detection."""
-        return {
-            'payment_obligation': r'\\b(?:shall pay|must pay|payment.{0,20}due)\\b',
-            'delivery_obligation': r'\\b(?:shall deliver|must provide|delivery.{0,20}required)\\b',
-            'performance_obligation': r'\\b(?:shall perform|must complete|performance.{0,20}required)\\b',
-            'notice_obligation': r'\\b(?:shall notify|must inform|notice.{0,20}required)\\b'
-        }
-    
-    def _build_conditional_patterns(self) -> List[str]:
-        """Build patterns for conditional statement detection."""
-        return [
-            r'\\bif\\b(.+?)\\bthen\\b',
-            r'\\bunless\\b(.+?)(?:,|\\.|;)',
-            r'\\bprovided that\\b(.+?)(?:,|\\.|;)',
-            r'\\bsubject to\\b(.+?)(?:,|\\.|;)'
-        ]
-    
-    def _build_temporal_patterns(self) -> Dict[str, str]:
-        """Build patterns for temporal element detection."""
-        return {
-            'deadline': r'\\b(?:by|before|no later than)\\s+[^,\\.]+',
-            'duration': r'\\b\\d+\\s*(?:day|week|month|year)s?\\b',
-            'frequency': r'\\b(?:daily|weekly|monthly|annually|quarterly)\\b',
-            'immediacy': r'\\b(?:immediately|promptly|forthwith|without delay)\\b'
-        }
+    def _extract_temporal_context(self, position: int, full_text: str,
+                                  sentence_starts: List[int]) -> str:
+        """Extract the sentence containing the temporal expression at ``position``."""
+        start = sentence_starts[bisect.bisect_right(sentence_starts, position) - 1]
+        end = full_text.find('.', start)
+        return full_text[start:end if end != -1 else len(full_text)].strip()
 
 
 def main():
@@ -6,19 +6,82 @@ Rule-based system for generating negotiation recommendations based on clause ana
 Provides actionable advice for contract improvements and risk mitigation.
 """
 
+import sys
+import copy
 import logging
+import functools
 import yaml
+from itertools import chain
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, FrozenSet, Tuple, Iterator
+from dataclasses import dataclass, replace
 
 from ..core.clause_analyzer import ClauseAnalysis, RiskLevel
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Recommendation priorities, most urgent first
+PRIORITY_RANK = {"Critical": 0, "High": 1, "Medium": 2, "Low": 3}
+
+# Keyword-driven opportunities per clause tag, checked in this order. Each
+# check is (keyword, unless_keyword, opportunity): the opportunity applies when
+# the lowercased content contains the keyword but not the unless keyword.
+_OPPORTUNITY_CHECKS = (
+    ('FIN', (
+        ('penalty', 'cap', "Consider negotiating penalty caps to limit financial exposure"),
+        ('payment', 'escrow', "Explore escrow arrangements for payment security"),
+        ('late', 'cure', "Request cure period before late payment penalties apply"),
+    )),
+    ('LEG', (
+        ('indemnif', 'mutual', "Push for mutual indemnification to balance liability"),
+        ('liability', 'limit', "Negotiate liability limitations and caps"),
+        ('jurisdiction', None, "Evaluate jurisdiction for favorability and convenience"),
+    )),
+    ('TEC', (
+        ('deliverable', 'acceptance', "Define clear acceptance criteria for deliverables"),
+        ('sla', 'remedy', "Include specific remedies for SLA breaches"),
+    )),
+    ('TRM', (
+        ('terminat', 'cure', "Negotiate cure periods before termination rights activate"),
+        ('convenience', None, "Seek reciprocal termination rights or notice periods"),
+    )),
+)
+
+
+# Bound for cached opportunity answers
+_OPPORTUNITY_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=_OPPORTUNITY_CACHE_SIZE)
+def _analyze_opportunities(content: str, tags: FrozenSet[str]) -> str:
+    """Keyword-driven opportunity analysis; a pure function of content and tags."""
+    opportunities = []
+    content_lower = None
+    
+    for tag, checks in _OPPORTUNITY_CHECKS:
+        if tag not in tags:
+            continue
+        if content_lower is None:
+            content_lower = content.lower()
+        for keyword, unless, opportunity in checks:
+            if keyword in content_lower and not (unless and unless in content_lower):
+                opportunities.append(opportunity)
+    
+    if not opportunities:
+        return "Consider standard commercial protections and balanced risk allocation."
+    
+    return "; ".join(opportunities) + "."
+
+
+@dataclass(slots=True)
 class NegotiationRecommendation:
     """Represents a specific negotiation recommendation."""
     clause_number: int
@@ -31,7 +94,7 @@ class NegotiationRecommendation:
     negotiation_strategy: str
 
 
-@dataclass
+@dataclass(slots=True)
 class NegotiationRule:
     """Represents a rule for generating negotiation advice."""
     name: str
@@ -40,6 +103,160 @@ class NegotiationRule:
     priority: str
 
 
+def _as_tuple(value) -> Tuple:
+    """Normalize a rule condition value given as a string or a list to a tuple."""
+    return (value,) if isinstance(value, str) else tuple(value)
+
+
+def _intern(value):
+    """Intern string labels loaded from rule files so comparisons hit the identity fast path."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledRule:
+    """
+    A NegotiationRule with its conditions normalized once at load time.
+    Absent conditions are None; keyword tuples are pre-lowercased. The
+    snapshot holds copies of the rule's conditions and template, so edits
+    made to the rule afterwards can be detected.
+    """
+    rule: NegotiationRule
+    snapshot: Tuple[Dict[str, Any], Dict[str, str]]
+    required_risk: Optional[str]
+    required_tags: Optional[FrozenSet[str]]
+    contains: Optional[Tuple[str, ...]]
+    lacks: Optional[Tuple[str, ...]]
+    
+    @classmethod
+    def from_rule(cls, rule: NegotiationRule) -> "CompiledRule":
+        """Compile a rule's condition dictionary."""
+        conditions = rule.conditions
+        return cls(
+            rule=rule,
+            snapshot=copy.deepcopy((conditions, rule.recommendation_template)),
+            required_risk=_intern(conditions.get('risk_level')),
+            required_tags=frozenset(
+                map(_intern, _as_tuple(conditions['tags']))
+            ) if 'tags' in conditions else None,
+            contains=tuple(
+                check.lower() for check in _as_tuple(conditions['content_contains'])
+            ) if 'content_contains' in conditions else None,
+            lacks=tuple(
+                lack.lower() for lack in _as_tuple(conditions['content_lacks'])
+            ) if 'content_lacks' in conditions else None
+        )
+    
+    def is_compiled_from(self, rule: NegotiationRule) -> bool:
+        """Check this was compiled from the given rule in its current state."""
+        return self.rule is rule and self.snapshot == (rule.conditions, rule.recommendation_template)
+    
+    @property
+    def checks_content(self) -> bool:
+        """Whether the rule has content conditions."""
+        return self.contains is not None or self.lacks is not None
+    
+    def applies_to_context(self, tags: FrozenSet[str], risk_level: RiskLevel) -> bool:
+        """Check the risk level and tag conditions."""
+        if self.required_risk is not None and risk_level.value != self.required_risk:
+            return False
+        
+        return self.required_tags is None or not self.required_tags.isdisjoint(tags)
+    
+    def applies_to_content(self, content_lower: str) -> bool:
+        """Check the content conditions against lowercased clause content."""
+        if self.contains is not None and not any(check in content_lower for check in self.contains):
+            return False
+        
+        return self.lacks is None or not any(lack in content_lower for lack in self.lacks)
+
+
+# Built-in rules used when no rules file is given; each advisor gets its own
+# copy, paired with the conditions compiled once here
+_DEFAULT_RULES: Tuple[NegotiationRule, ...] = (
+    NegotiationRule(
+        name="High Financial Risk",
+        conditions={
+            'risk_level': 'Critical',
+            'tags': ['FIN']
+        },
+        recommendation_template={
+            'type': 'redline',
+            'opportunity': 'Critical financial risk requires immediate attention and likely redlining',
+            'suggested_change': 'Add liability caps, penalty limitations, and payment protections',
+            'rationale': 'Excessive financial exposure poses significant business risk',
+            'strategy': 'Demand material revisions or consider contract rejection'
+        },
+        priority='Critical'
+    ),
+    NegotiationRule(
+        name="Unlimited Liability",
+        conditions={
+            'content_contains': ['liable', 'liability'],
+            'content_lacks': ['limit', 'cap']
+        },
+        recommendation_template={
+            'type': 'addition',
+            'opportunity': 'Unlimited liability exposure should be capped',
+            'suggested_change': 'Add liability limitations clause capping damages',
+            'rationale': 'Unlimited liability creates unacceptable business risk',
+            'strategy': 'Negotiate specific dollar amount caps or limit to contract value'
+        },
+        priority='High'
+    ),
+    NegotiationRule(
+        name="One-sided Indemnification",
+        conditions={
+            'content_contains': ['indemnif'],
+            'content_lacks': ['mutual', 'reciprocal']
+        },
+        recommendation_template={
+            'type': 'redline',
+            'opportunity': 'One-sided indemnification should be made mutual',
+            'suggested_change': 'Revise to mutual indemnification provisions',
+            'rationale': 'Asymmetric indemnification creates unfair risk allocation',
+            'strategy': 'Push for balanced mutual protections'
+        },
+        priority='High'
+    ),
+    NegotiationRule(
+        name="Vague Deliverables",
+        conditions={
+            'tags': ['TEC'],
+            'content_contains': ['deliverable'],
+            'content_lacks': ['specific', 'criteria']
+        },
+        recommendation_template={
+            'type': 'clarification',
+            'opportunity': 'Deliverable specifications need clarification to prevent disputes',
+            'suggested_change': 'Add detailed acceptance criteria and specifications',
+            'rationale': 'Vague deliverables lead to scope disputes and project delays',
+            'strategy': 'Define clear, measurable deliverable requirements'
+        },
+        priority='Medium'
+    ),
+    NegotiationRule(
+        name="Missing Cure Period",
+        conditions={
+            'tags': ['TRM'],
+            'content_contains': ['breach', 'default', 'terminat'],
+            'content_lacks': ['cure', 'remedy']
+        },
+        recommendation_template={
+            'type': 'addition',
+            'opportunity': 'Add cure period before termination or penalty application',
+            'suggested_change': 'Include reasonable cure period (e.g., 30 days written notice)',
+            'rationale': 'Cure periods provide opportunity to address issues before severe consequences',
+            'strategy': 'Negotiate fair notice and cure provisions'
+        },
+        priority='Medium'
+    ),
+)
+_DEFAULT_COMPILED_RULES: Tuple[CompiledRule, ...] = tuple(
+    CompiledRule.from_rule(rule) for rule in _DEFAULT_RULES
+)
+
+
 class NegotiationAdvisor:
     """
     AI-powered negotiation advisor that analyzes contract clauses and
@@ -54,15 +271,49 @@ class NegotiationAdvisor:
             rules_path: Optional path to custom rules file
         """
         self.logger = logging.getLogger(__name__)
-        self.rules: List[NegotiationRule] = []
+        self._rules_path = rules_path
+        
+        # Rules are loaded on first use (see the rules property)
+        self._rules: Optional[List[NegotiationRule]] = None
+        self._compiled_rules: List[CompiledRule] = []
+        self._opportunity_cache: Dict[tuple, str] = {}
         
-        # Load negotiation rules
-        if rules_path and rules_path.exists():
-            self._load_rules_from_file(rules_path)
+        self.logger.info("NegotiationAdvisor initialized")
+    
+    @property
+    def rules(self) -> List[NegotiationRule]:
+        """Negotiation rules, loaded from the rules file or defaults on first access."""
+        self._ensure_rules_loaded()
+        return self._rules
+    
+    @rules.setter
+    def rules(self, rules: List[NegotiationRule]) -> None:
+        """Replace the negotiation rules; they are compiled again on next use."""
+        self._rules = rules
+        self._compiled_rules = []
+        self._opportunity_cache.clear()
+    
+    def _ensure_rules_loaded(self) -> None:
+        """Load negotiation rules if they have not been loaded yet."""
+        if self._rules is not None:
+            # Recompile if callers added, removed, replaced or edited rules in the public list
+            if len(self._compiled_rules) != len(self._rules) or not all(
+                compiled.is_compiled_from(rule) for compiled, rule in zip(self._compiled_rules, self._rules)
+            ):
+                self._compiled_rules = [CompiledRule.from_rule(rule) for rule in self._rules]
+                self._opportunity_cache.clear()
+            return
+        
+        self._rules = []
+        self._compiled_rules = []
+        self._opportunity_cache.clear()
+        
+        if self._rules_path and self._rules_path.exists():
+            self._load_rules_from_file(self._rules_path)
         else:
             self._load_default_rules()
         
-        self.logger.info(f"NegotiationAdvisor initialized with {len(self.rules)} rules")
+        self.logger.info(f"Loaded {len(self._rules)} negotiation rules")
     
     def identify_opportunities(
         self, 
@@ -81,18 +332,29 @@ class NegotiationAdvisor:
         Returns:
             Negotiation opportunity description
         """
-        opportunities = []
+        self._ensure_rules_loaded()
+        
+        # Boilerplate clauses repeat across a contract; reuse earlier answers
+        cache_key = (clause.content, clause.title, tuple(tags), risk_level)
+        cached = self._opportunity_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         # Apply rules to identify opportunities
-        for rule in self.rules:
-            if self._rule_applies(rule, clause, tags, risk_level):
-                opportunity = self._generate_opportunity_text(rule, clause, tags, risk_level)
-                opportunities.append(opportunity)
+        opportunities = [
+            self._generate_opportunity_text(rule, clause, tags, risk_level)
+            for rule in self._matching_rules(clause, tags, risk_level)
+        ]
         
-        if not opportunities:
-            return "No specific negotiation opportunities identified for this clause."
+        if opportunities:
+            result = " ".join(opportunities)
+        else:
+            result = "No specific negotiation opportunities identified for this clause."
         
-        return " ".join(opportunities)
+        if len(self._opportunity_cache) >= _OPPORTUNITY_CACHE_SIZE:
+            self._opportunity_cache.clear()
+        self._opportunity_cache[cache_key] = result
+        return result
     
     def analyze_opportunities(self, content: str, tags: List[str]) -> str:
         """
@@ -105,45 +367,7 @@ class NegotiationAdvisor:
         Returns:
             Negotiation opportunity analysis
         """
-        content_lower = content.lower()
-        opportunities = []
-        
-        # Financial opportunities
-        if 'FIN' in tags:
-            if 'penalty' in content_lower and 'cap' not in content_lower:
-                opportunities.append("Consider negotiating penalty caps to limit financial exposure")
-            if 'payment' in content_lower and 'escrow' not in content_lower:
-                opportunities.append("Explore escrow arrangements for payment security")
-            if 'late' in content_lower and 'cure' not in content_lower:
-                opportunities.append("Request cure period before late payment penalties apply")
-        
-        # Legal opportunities
-        if 'LEG' in tags:
-            if 'indemnif' in content_lower and 'mutual' not in content_lower:
-                opportunities.append("Push for mutual indemnification to balance liability")
-            if 'liability' in content_lower and 'limit' not in content_lower:
-                opportunities.append("Negotiate liability limitations and caps")
-            if 'jurisdiction' in content_lower:
-                opportunities.append("Evaluate jurisdiction for favorability and convenience")
-        
-        # Technical opportunities
-        if 'TEC' in tags:
-            if 'deliverable' in content_lower and 'acceptance' not in content_lower:
-                opportunities.append("Define clear acceptance criteria for deliverables")
-            if 'sla' in content_lower and 'remedy' not in content_lower:
-                opportunities.append("Include specific remedies for SLA breaches")
-        
-        # Termination opportunities
-        if 'TRM' in tags:
-            if 'terminat' in content_lower and 'cure' not in content_lower:
-                opportunities.append("Negotiate cure periods before termination rights activate")
-            if 'convenience' in content_lower:
-                opportunities.append("Seek reciprocal termination rights or notice periods")
-        
-        if not opportunities:
-            return "Consider standard commercial protections and balanced risk allocation."
-        
-        return "; ".join(opportunities) + "."
+        return _analyze_opportunities(content, frozenset(tags))
     
     def generate_recommendations(
         self, 
@@ -158,17 +382,16 @@ class NegotiationAdvisor:
         Returns:
             List of prioritized negotiation recommendations
         """
-        recommendations = []
+        # Bucket by priority (Critical -> High -> Medium -> Low, then unknown);
+        # buckets keep generation order, so this matches a stable sort
+        buckets = [[] for _ in range(len(PRIORITY_RANK) + 1)]
+        unknown_rank = len(PRIORITY_RANK)
         
         for analysis in clause_analyses:
-            clause_recommendations = self._generate_clause_recommendations(analysis)
-            recommendations.extend(clause_recommendations)
-        
-        # Sort by priority (Critical -> High -> Medium -> Low)
-        priority_order = {"Critical": 0, "High": 1, "Medium": 2, "Low": 3}
-        recommendations.sort(key=lambda r: priority_order.get(r.priority, 4))
+            for rec in self._generate_clause_recommendations(analysis):
+                buckets[PRIORITY_RANK.get(rec.priority, unknown_rank)].append(rec)
         
-        return recommendations
+        return list(chain.from_iterable(buckets))
     
     def _generate_clause_recommendations(
         self, 
@@ -178,61 +401,33 @@ class NegotiationAdvisor:
         recommendations = []
         
         # Apply each rule to the clause
-        for rule in self.rules:
-            if self._rule_applies_to_analysis(rule, analysis):
-                rec = self._create_recommendation_from_rule(rule, analysis)
-                if rec:
-                    recommendations.append(rec)
+        for rule in self._matching_rules(analysis.clause, analysis.tags, analysis.risk_level):
+            rec = self._create_recommendation_from_rule(rule, analysis)
+            if rec:
+                recommendations.append(rec)
         
         return recommendations
     
-    def _rule_applies(
-        self, 
-        rule: NegotiationRule, 
-        clause, 
-        tags: List[str], 
-        risk_level: RiskLevel
-    ) -> bool:
-        """Check if a rule applies to the given clause context."""
-        conditions = rule.conditions
-        
-        # Check risk level condition
-        if 'risk_level' in conditions:
-            required_risk = conditions['risk_level']
-            if risk_level.value != required_risk:
-                return False
-        
-        # Check tag conditions
-        if 'tags' in conditions:
-            required_tags = conditions['tags']
-            if isinstance(required_tags, str):
-                required_tags = [required_tags]
-            if not any(tag in tags for tag in required_tags):
-                return False
-        
-        # Check content conditions
-        if 'content_contains' in conditions:
-            content_checks = conditions['content_contains']
-            if isinstance(content_checks, str):
-                content_checks = [content_checks]
-            content_lower = clause.content.lower()
-            if not any(check.lower() in content_lower for check in content_checks):
-                return False
+    def _matching_rules(self, clause, tags: List[str], risk_level: RiskLevel) -> Iterator[NegotiationRule]:
+        """
+        Yield the rules whose conditions hold for a clause.
         
-        # Check content absence conditions
-        if 'content_lacks' in conditions:
-            content_lacks = conditions['content_lacks']
-            if isinstance(content_lacks, str):
-                content_lacks = [content_lacks]
-            content_lower = clause.content.lower()
-            if any(lack.lower() in content_lower for lack in content_lacks):
-                return False
+        Risk level and tag conditions are checked first; the clause content is
+        lowercased only once a rule passing them has content conditions.
+        """
+        self._ensure_rules_loaded()
+        tag_set = frozenset(tags)
+        content_lower = None
         
-        return True
-    
-    def _rule_applies_to_analysis(self, rule: NegotiationRule, analysis: ClauseAnalysis) -> bool:
-        """Check if a rule applies to a clause analysis."""
-        return self._rule_applies(rule, analysis.clause, analysis.tags, analysis.risk_level)
+        for compiled in self._compiled_rules:
+            if not compiled.applies_to_context(tag_set, risk_level):
+                continue
+            if compiled.checks_content:
+                if content_lower is None:
+                    content_lower = clause.content.lower()
+                if not compiled.applies_to_content(content_lower):
+                    continue
+            yield compiled.rule
     
     def _generate_opportunity_text(
         self, 
@@ -258,32 +453,45 @@ class NegotiationAdvisor:
     ) -> Optional[NegotiationRecommendation]:
         """Create a negotiation recommendation from a rule and analysis."""
         template = rule.recommendation_template
+        clause = analysis.clause
+        content = clause.content
+        
+        # Only build the risk-specific default when the template has no rationale
+        rationale = template.get('rationale')
+        if rationale is None:
+            rationale = f"Address {analysis.risk_level.value.lower()} risk factors"
         
         return NegotiationRecommendation(
-            clause_number=analysis.clause.number,
-            clause_title=analysis.clause.title,
+            clause_number=clause.number,
+            clause_title=clause.title,
             priority=rule.priority,
             recommendation_type=template.get('type', 'clarification'),
-            current_text=analysis.clause.content[:200] + "..." if len(analysis.clause.content) > 200 else analysis.clause.content,
+            current_text=content[:200] + "..." if len(content) > 200 else content,
             suggested_change=template.get('suggested_change', 'Review and clarify this clause'),
-            rationale=template.get('rationale', f"Address {analysis.risk_level.value.lower()} risk factors"),
+            rationale=rationale,
             negotiation_strategy=template.get('strategy', 'Discuss with legal counsel')
         )
     
+    def _add_rule(self, rule: NegotiationRule) -> None:
+        """Register a rule along with its compiled conditions."""
+        compiled = CompiledRule.from_rule(rule)
+        self._rules.append(rule)
+        self._compiled_rules.append(compiled)
+    
     def _load_rules_from_file(self, rules_path: Path) -> None:
         """Load negotiation rules from YAML file."""
         try:
             with open(rules_path, 'r') as f:
-                rules_data = yaml.safe_load(f)
+                rules_data = yaml.load(f, Loader=_YamlLoader)
             
             for rule_data in rules_data.get('negotiation_rules', []):
                 rule = NegotiationRule(
                     name=rule_data['name'],
                     conditions=rule_data['conditions'],
                     recommendation_template=rule_data['recommendation'],
-                    priority=rule_data.get('priority', 'Medium')
+                    priority=_intern(rule_data.get('priority', 'Medium'))
                 )
-                self.rules.append(rule)
+                self._add_rule(rule)
                 
         except Exception as e:
             self.logger.error(f"Failed to load rules from {rules_path}: {e}")
@@ -291,85 +499,8 @@ class NegotiationAdvisor:
     
     def _load_default_rules(self) -> None:
         """Load default negotiation rules."""
-        default_rules = [
-            NegotiationRule(
-                name="High Financial Risk",
-                conditions={
-                    'risk_level': 'Critical',
-                    'tags': ['FIN']
-                },
-                recommendation_template={
-                    'type': 'redline',
-                    'opportunity': 'Critical financial risk requires immediate attention and likely redlining',
-                    'suggested_change': 'Add liability caps, penalty limitations, and payment protections',
-                    'rationale': 'Excessive financial exposure poses significant business risk',
-                    'strategy': 'Demand material revisions or consider contract rejection'
-                },
-                priority='Critical'
-            ),
-            NegotiationRule(
-                name="Unlimited Liability",
-                conditions={
-                    'content_contains': ['liable', 'liability'],
-                    'content_lacks': ['limit', 'cap']
-                },
-                recommendation_template={
-                    'type': 'addition',
-                    'opportunity': 'Unlimited liability exposure should be capped',
-                    'suggested_change': 'Add liability limitations clause capping damages',
-                    'rationale': 'Unlimited liability creates unacceptable business risk',
-                    'strategy': 'Negotiate specific dollar amount caps or limit to contract value'
-                },
-                priority='High'
-            ),
-            NegotiationRule(
-                name="One-sided Indemnification",
-                conditions={
-                    'content_contains': ['indemnif'],
-                    'content_lacks': ['mutual', 'reciprocal']
-                },
-                recommendation_template={
-                    'type': 'redline',
-                    'opportunity': 'One-sided indemnification should be made mutual',
-                    'suggested_change': 'Revise to mutual indemnification provisions',
-                    'rationale': 'Asymmetric indemnification creates unfair risk allocation',
-                    'strategy': 'Push for balanced mutual protections'
-                },
-                priority='High'
-            ),
-            NegotiationRule(
-                name="Vague Deliverables",
-                conditions={
-                    'tags': ['TEC'],
-                    'content_contains': ['deliverable'],
-                    'content_lacks': ['specific', 'criteria']
-                },
-                recommendation_template={
-                    'type': 'clarification',
-                    'opportunity': 'Deliverable specifications need clarification to prevent disputes',
-                    'suggested_change': 'Add detailed acceptance criteria and specifications',
-                    'rationale': 'Vague deliverables lead to scope disputes and project delays',
-                    'strategy': 'Define clear, measurable deliverable requirements'
-                },
-                priority='Medium'
-            ),
-            NegotiationRule(
-                name="Missing Cure Period",
-                conditions={
-                    'tags': ['TRM'],
-                    'content_contains': ['breach', 'default', 'terminat'],
-                    'content_lacks': ['cure', 'remedy']
-                },
-                recommendation_template={
-                    'type': 'addition',
-                    'opportunity': 'Add cure period before termination or penalty application',
-                    'suggested_change': 'Include reasonable cure period (e.g., 30 days written notice)',
-                    'rationale': 'Cure periods provide opportunity to address issues before severe consequences',
-                    'strategy': 'Negotiate fair notice and cure provisions'
-                },
-                priority='Medium'
-            )
-        ]
-        
-        self.rules.extend(default_rules)
-        self.logger.info(f"Loaded {len(default_rules)} default negotiation rules")
\ No newline at end of file
+        for compiled in _DEFAULT_COMPILED_RULES:
+            rule = copy.deepcopy(compiled.rule)
+            self._rules.append(rule)
+            self._compiled_rules.append(replace(compiled, rule=rule))
+        self.logger.info(f"Loaded {len(_DEFAULT_RULES)} default negotiation rules")
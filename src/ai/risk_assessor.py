@@ -6,15 +6,61 @@ Evaluates legal and business risks in contract clauses.
 Provides risk scoring, vulnerability identification, and risk factor analysis.
 """
 
+import hashlib
+import heapq
 import logging
 import re
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Tuple, Optional, FrozenSet
+from dataclasses import dataclass, field
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
 
+# Every literal keyword the risk checks look for. A clause is scanned for all
+# of them once; the checks then test membership in the resulting hit set.
+_RISK_KEYWORDS: Tuple[str, ...] = (
+    # Financial
+    'payment', 'penalty', 'interest', 'liable', 'limit',
+    'currency', 'exchange', 'usd', 'eur', 'hedg', 'fix',
+    # Legal
+    'jurisdiction', 'foreign', 'offshore', 'international arbitration',
+    'indemnif', 'mutual', 'reciprocal', 'warrant', 'guarantee', 'disclaim',
+    'terminat', 'convenience', 'cure',
+    # Operational
+    'deliverable', 'specific', 'depend', 'third party',
+    # Compliance
+    'regulation', 'compliance', 'law', 'current', 'data', 'gdpr', 'privacy',
+    'financial', 'money', 'aml',
+    # Reputational
+    'public', 'disclosure', 'confidential', 'quality', 'standard',
+    # Strategic
+    'intellectual property', 'copyright', 'license back', 'retain', 'exclusive', 'term',
+    # Tag-specific vulnerabilities
+    'escrow', 'cap', 'sla', 'remedy', 'acceptance', 'liability', 'insurance',
+)
+
+
+# Penalty percentage stated shortly before "penalty" in the same sentence
+_PENALTY_RE = re.compile(r'(\d+)\s*%[^.]{0,40}penalty', re.IGNORECASE)
+
+# Timeline expressions checked for unrealistically tight deadlines; the
+# units are scanned in one pass and reported in this order
+_TIMELINE_RE = re.compile(r'(\d+)\s*(day|hour|week)s?', re.IGNORECASE)
+_TIMELINE_UNITS = ('days', 'hours', 'weeks')
+
+
+# Maximum number of clause assessments kept per assessor
+_ASSESSMENT_CACHE_SIZE = 4096
+
+
+def _scan_risk_keywords(content_lower: str) -> FrozenSet[str]:
+    """Return the risk keywords that occur in lowercased clause content."""
+    return frozenset(filter(content_lower.__contains__, _RISK_KEYWORDS))
+
+
 class RiskCategory(Enum):
     """Categories of contract risks."""
     FINANCIAL = "Financial"
@@ -25,7 +71,7 @@ class RiskCategory(Enum):
     STRATEGIC = "Strategic"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RiskFactor:
     """Individual risk factor with metadata."""
     category: RiskCategory
@@ -34,9 +80,15 @@ class RiskFactor:
     likelihood: float  # 0-1 probability
     impact: str
     mitigation: Optional[str] = None
+    # "Category: description" as reported by assess_risk, formatted once
+    label: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Format the reported label once; the dataclass is frozen."""
+        object.__setattr__(self, 'label', f"{self.category.value}: {self.description}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RiskAssessment:
     """Complete risk assessment for a clause."""
     overall_score: float
@@ -46,6 +98,239 @@ class RiskAssessment:
     recommendations: List[str]
 
 
+@dataclass(frozen=True, slots=True)
+class _RiskRule:
+    """
+    Keyword-driven risk rule evaluated against a clause's risk keyword hits.
+    
+    The rule fires when every group in ``requires`` has at least one hit and
+    no group in ``excludes`` is fully present. Its risk factor is immutable,
+    so one instance is built up front and shared by every matching clause.
+    """
+    requires: Tuple[FrozenSet[str], ...]
+    excludes: Tuple[FrozenSet[str], ...]
+    factor: RiskFactor
+    
+    def matches(self, hits: FrozenSet[str]) -> bool:
+        """Check whether the rule applies to the given keyword hits."""
+        # Plain loops: this runs for every rule on every clause, and most
+        # rules already fail on their first group
+        for group in self.requires:
+            if group.isdisjoint(hits):
+                return False
+        for group in self.excludes:
+            if group <= hits:
+                return False
+        return True
+
+
+def _rule(category: RiskCategory, requires, excludes, description: str,
+          severity: float, likelihood: float, impact: str) -> _RiskRule:
+    """Build a rule from keyword groups given as tuples of strings."""
+    if not requires:
+        raise ValueError("a risk rule must require at least one keyword group")
+    return _RiskRule(
+        requires=tuple(frozenset(group) for group in requires),
+        excludes=tuple(frozenset(group) for group in excludes),
+        factor=RiskFactor(
+            category=category,
+            description=description,
+            severity=severity,
+            likelihood=likelihood,
+            impact=impact
+        )
+    )
+
+
+def _penalty_risks(content: str) -> List[RiskFactor]:
+    """Flag penalty percentages above 5%."""
+    penalty_match = _PENALTY_RE.search(content)
+    if penalty_match:
+        penalty_rate = float(penalty_match.group(1))
+        if penalty_rate > 5:
+            return [RiskFactor(
+                category=RiskCategory.FINANCIAL,
+                description=f"High penalty rate of {penalty_rate}% may be excessive",
+                severity=7.0,
+                likelihood=0.3,
+                impact="Disproportionate financial penalties"
+            )]
+    return []
+
+
+def _timeline_risks(content: str) -> List[RiskFactor]:
+    """Flag timelines shorter than three days."""
+    risks = []
+    
+    # One scan, grouped by unit in the reported order
+    matches_by_unit = {unit: [] for unit in _TIMELINE_UNITS}
+    for amount, unit in _TIMELINE_RE.findall(content):
+        matches_by_unit[unit.lower() + 's'].append(amount)
+    
+    for unit, matches in matches_by_unit.items():
+        for match in matches:
+            days = int(match)
+            if unit == 'hours':
+                days = days / 24
+            elif unit == 'weeks':
+                days = days * 7
+            
+            if days < 3:  # Very tight timeline
+                risks.append(RiskFactor(
+                    category=RiskCategory.OPERATIONAL,
+                    description=f"Tight timeline of {match} {unit} may be unrealistic",
+                    severity=5.0,
+                    likelihood=0.5,
+                    impact="Risk of delivery delays and penalty exposure"
+                ))
+    
+    return risks
+
+
+# Risk checks in reporting order. Keyword rules test the clause's hit set;
+# the pattern checks are functions of the raw clause content.
+_RISK_RULES = (
+    # Financial
+    _rule(RiskCategory.FINANCIAL, [('payment',)], [('penalty', 'interest')],
+          "Payment terms lack penalty provisions for late payment", 6.0, 0.3,
+          "Potential cash flow issues and collection difficulties"),
+    _rule(RiskCategory.FINANCIAL, [('liable',)], [('limit',)],
+          "Unlimited liability exposure without caps", 8.0, 0.2,
+          "Potentially catastrophic financial exposure"),
+    _rule(RiskCategory.FINANCIAL, [('currency', 'exchange', 'usd', 'eur')], [('hedg',), ('fix',)],
+          "Currency exchange rate risk without hedging", 5.0, 0.4,
+          "Potential financial losses from rate fluctuations"),
+    _penalty_risks,
+    # Legal
+    _rule(RiskCategory.LEGAL, [('jurisdiction',), ('foreign', 'offshore', 'international arbitration')], [],
+          "Potentially unfavorable jurisdiction for dispute resolution", 7.0, 0.2,
+          "Increased legal costs and procedural disadvantages"),
+    _rule(RiskCategory.LEGAL, [('indemnif',)], [('mutual',), ('reciprocal',)],
+          "One-sided indemnification obligations", 6.5, 0.3,
+          "Asymmetric legal protection and liability exposure"),
+    _rule(RiskCategory.LEGAL, [('warrant', 'guarantee')], [('disclaim',)],
+          "Broad warranty obligations without disclaimers", 5.5, 0.4,
+          "Potential warranty claims and associated costs"),
+    _rule(RiskCategory.LEGAL, [('terminat',), ('convenience',)], [('cure',)],
+          "Termination for convenience without cure period", 6.0, 0.25,
+          "Risk of abrupt contract termination"),
+    # Operational
+    _timeline_risks,
+    _rule(RiskCategory.OPERATIONAL, [('deliverable',)], [('specific',)],
+          "Vague deliverable specifications may lead to scope disputes", 6.0, 0.4,
+          "Scope creep and delivery disagreements"),
+    _rule(RiskCategory.OPERATIONAL, [('depend', 'third party')], [],
+          "Third-party dependencies create operational risks", 4.5, 0.3,
+          "Potential delays due to external factors"),
+    # Compliance
+    _rule(RiskCategory.COMPLIANCE, [('regulation', 'compliance', 'law')], [('current',)],
+          "Compliance obligations may not reflect current regulations", 6.5, 0.3,
+          "Regulatory violations and associated penalties"),
+    _rule(RiskCategory.COMPLIANCE, [('data',)], [('gdpr',), ('privacy',)],
+          "Data handling without explicit privacy protections", 7.0, 0.4,
+          "Privacy violations and regulatory fines"),
+    _rule(RiskCategory.COMPLIANCE, [('payment', 'financial', 'money')], [('aml',)],
+          "Financial operations without AML/CTF compliance measures", 5.5, 0.2,
+          "Anti-money laundering compliance issues"),
+    # Reputational
+    _rule(RiskCategory.REPUTATIONAL, [('public', 'disclosure')], [('confidential',)],
+          "Public disclosure without confidentiality protections", 5.0, 0.3,
+          "Potential reputation damage from public exposure"),
+    _rule(RiskCategory.REPUTATIONAL, [('quality',)], [('standard',)],
+          "Quality expectations without defined standards", 4.0, 0.4,
+          "Risk of quality disputes affecting reputation"),
+    # Strategic
+    _rule(RiskCategory.STRATEGIC, [('intellectual property', 'copyright')], [('license back',), ('retain',)],
+          "IP transfer without license-back rights", 7.5, 0.2,
+          "Loss of strategic IP assets and future licensing opportunities"),
+    _rule(RiskCategory.STRATEGIC, [('exclusive',)], [('term',)],
+          "Indefinite exclusivity arrangements", 6.0, 0.25,
+          "Strategic flexibility limitations"),
+)
+
+# Content pattern checks from the rule table, in the same order
+_PATTERN_CHECKS = tuple(rule for rule in _RISK_RULES if not isinstance(rule, _RiskRule))
+
+
+# Patterns for risk detection
+_RISK_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    'high_risk_terms': (
+        'unlimited liability', 'personal guarantee', 'joint and several',
+        'in perpetuity', 'irrevocable', 'unconditional'
+    ),
+    'financial_risks': (
+        'penalty', 'liquidated damages', 'late fee', 'interest',
+        'collection costs', 'attorney fees'
+    ),
+    'legal_risks': (
+        'indemnification', 'hold harmless', 'breach', 'default',
+        'termination', 'injunctive relief'
+    )
+}
+
+# Indicators for vulnerability detection
+_VULNERABILITY_INDICATORS: Dict[str, Tuple[str, ...]] = {
+    'asymmetric_terms': (
+        'solely responsible', 'exclusively liable', 'bears all costs',
+        'at own expense', 'without recourse'
+    ),
+    'vague_language': (
+        'reasonable efforts', 'best efforts', 'commercially reasonable',
+        'appropriate measures', 'satisfactory performance'
+    ),
+    'missing_protections': (
+        'without warranty', 'as is', 'no guarantee',
+        'disclaim all liability', 'exclude all warranties'
+    )
+}
+
+
+def _flatten_vulnerability_indicators(
+    indicators_by_category: Dict[str, Tuple]
+) -> Tuple[Tuple[Tuple[str, str], ...], Tuple[Tuple[re.Pattern, str], ...]]:
+    """Flatten vulnerability indicators into (matcher, label) pairs split by kind."""
+    phrases = []
+    patterns = []
+    for category, indicators in indicators_by_category.items():
+        for indicator in indicators:
+            if isinstance(indicator, str):
+                phrases.append((indicator.lower(), f"{category}: {indicator}"))
+            else:  # precompiled regex pattern
+                patterns.append((indicator, f"{category}: pattern match"))
+    return tuple(phrases), tuple(patterns)
+
+
+_INDICATOR_PHRASES, _INDICATOR_PATTERNS = _flatten_vulnerability_indicators(_VULNERABILITY_INDICATORS)
+
+# Weighting factors for different risk categories
+_RISK_WEIGHTS: Dict[RiskCategory, float] = {
+    RiskCategory.FINANCIAL: 1.2,
+    RiskCategory.LEGAL: 1.1,
+    RiskCategory.OPERATIONAL: 0.9,
+    RiskCategory.COMPLIANCE: 1.0,
+    RiskCategory.REPUTATIONAL: 0.8,
+    RiskCategory.STRATEGIC: 1.0
+}
+
+# Mitigation strategies for common risks
+_MITIGATION_STRATEGIES: Dict[RiskCategory, Dict[str, str]] = {
+    RiskCategory.FINANCIAL: {
+        "Payment terms lack penalty provisions": "Add late payment penalties and interest charges",
+        "Unlimited liability exposure": "Insert liability caps and limitations",
+        "Currency exchange rate risk": "Include currency hedging or fixed rate provisions"
+    },
+    RiskCategory.LEGAL: {
+        "One-sided indemnification": "Negotiate mutual indemnification provisions",
+        "Unfavorable jurisdiction": "Seek neutral jurisdiction or alternative dispute resolution",
+        "Broad warranty obligations": "Add warranty disclaimers and limitations"
+    },
+    RiskCategory.OPERATIONAL: {
+        "Tight timeline": "Request realistic deadlines with force majeure protection",
+        "Vague deliverable specifications": "Demand detailed specifications and acceptance criteria"
+    }
+}
+
+
 class RiskAssessor:
     """
     AI-powered risk assessment engine for legal contract clauses.
@@ -54,10 +339,18 @@ class RiskAssessor:
     
     def __init__(self):
         """Initialize risk assessor with risk patterns and scoring matrices."""
-        self.risk_patterns = self._build_risk_patterns()
-        self.vulnerability_indicators = self._build_vulnerability_indicators()
-        self.risk_weights = self._build_risk_weights()
-        self.mitigation_strategies = self._build_mitigation_strategies()
+        # Fixed risk tables are shared module constants
+        self.risk_patterns = _RISK_PATTERNS
+        self.vulnerability_indicators = _VULNERABILITY_INDICATORS
+        self._indicator_phrases = _INDICATOR_PHRASES
+        self._indicator_patterns = _INDICATOR_PATTERNS
+        self.risk_weights = _RISK_WEIGHTS
+        self.mitigation_strategies = _MITIGATION_STRATEGIES
+        
+        # Boilerplate clauses recur across contracts; assessments are kept in
+        # an LRU keyed by a digest of the clause text and its tag set
+        self._assessment_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
         
         logger.info("RiskAssessor initialized")
     
@@ -75,11 +368,34 @@ class RiskAssessor:
         assessment = self._perform_full_assessment(clause.content, tags)
         
         # Extract risk factors as strings for backward compatibility
-        risk_factors = [f"{rf.category.value}: {rf.description}" for rf in assessment.primary_risks]
+        risk_factors = [rf.label for rf in assessment.primary_risks]
         
         logger.debug(f"Risk assessment complete: {assessment.overall_score:.2f}")
         return assessment.overall_score, risk_factors
     
+    def assess_risk_batch(
+        self,
+        clauses: List,
+        tags_list: List[List[str]]
+    ) -> List[Tuple[float, List[str]]]:
+        """
+        Assess many clauses at once.
+        
+        Clauses are assessed in-process; repeated clauses are served from the
+        assessment cache.
+        
+        Args:
+            clauses: Clause objects to assess
+            tags_list: Classification tags per clause
+        
+        Returns:
+            (risk_score, risk_factors_list) per clause, in input order
+        """
+        if len(tags_list) != len(clauses):
+            raise ValueError("tags_list must have one entry per clause")
+        
+        return [self.assess_risk(clause, tags) for clause, tags in zip(clauses, tags_list)]
+    
     def identify_vulnerabilities(self, content: str, tags: List[str]) -> List[str]:
         """
         Identify specific vulnerabilities in clause content.
@@ -91,343 +407,124 @@ class RiskAssessor:
         Returns:
             List of identified vulnerabilities
         """
-        vulnerabilities = []
-        content_lower = content.lower()
+        assessment = self._cached_assessment(self._assessment_key(content, tags))
+        if assessment is not None:
+            return list(assessment.vulnerabilities)
         
-        # Check each vulnerability category
-        for category, indicators in self.vulnerability_indicators.items():
-            for indicator in indicators:
-                if isinstance(indicator, str):
-                    if indicator.lower() in content_lower:
-                        vulnerabilities.append(f"{category}: {indicator}")
-                else:  # regex pattern
-                    if re.search(indicator, content, re.IGNORECASE):
-                        vulnerabilities.append(f"{category}: pattern match")
+        content_lower = content.lower()
+        return self._find_vulnerabilities(
+            content, content_lower, _scan_risk_keywords(content_lower), tags
+        )
+    
+    def _find_vulnerabilities(
+        self, 
+        content: str, 
+        content_lower: str, 
+        hits: FrozenSet[str], 
+        tags: List[str]
+    ) -> List[str]:
+        """Identify vulnerabilities from already lowercased content and keyword hits."""
+        # Check every indicator in one flat pass
+        vulnerabilities = [label for phrase, label in self._indicator_phrases if phrase in content_lower]
+        vulnerabilities.extend(
+            label for pattern, label in self._indicator_patterns if pattern.search(content)
+        )
         
         # Tag-specific vulnerability checks
-        tag_specific = self._check_tag_specific_vulnerabilities(content, tags)
+        tag_specific = self._check_tag_specific_vulnerabilities(hits, tags)
         vulnerabilities.extend(tag_specific)
         
-        return list(set(vulnerabilities))  # Remove duplicates
+        return list(dict.fromkeys(vulnerabilities))  # Remove duplicates, keep order
     
     def _perform_full_assessment(self, content: str, tags: List[str]) -> RiskAssessment:
-        """Perform comprehensive risk assessment."""
+        """Perform comprehensive risk assessment, reusing cached results for repeated clauses."""
+        cache_key = self._assessment_key(content, tags)
+        assessment = self._cached_assessment(cache_key)
+        if assessment is not None:
+            return assessment
+        
         risk_factors = []
-        content_lower = content.lower()
         
-        # Analyze each risk category
-        for category in RiskCategory:
-            category_risks = self._assess_category_risk(content, category, tags)
-            risk_factors.extend(category_risks)
+        # Lowercase and scan once; every check below shares the result
+        content_lower = content.lower()
+        hits = _scan_risk_keywords(content_lower)
+        
+        # Evaluate the rule table in category order. Every keyword rule needs
+        # at least one hit, so clauses without any (headings, numbering
+        # fragments) only run the pattern checks.
+        if hits:
+            for rule in _RISK_RULES:
+                if isinstance(rule, _RiskRule):
+                    if rule.matches(hits):
+                        risk_factors.append(rule.factor)
+                else:
+                    risk_factors.extend(rule(content))
+        else:
+            for check in _PATTERN_CHECKS:
+                risk_factors.extend(check(content))
         
         # Calculate overall score
         overall_score = self._calculate_overall_score(risk_factors)
         
         # Get primary risks (top severity)
-        primary_risks = sorted(risk_factors, key=lambda x: x.severity, reverse=True)[:5]
+        primary_risks = heapq.nlargest(5, risk_factors, key=lambda x: x.severity)
         
         # Calculate risk distribution
         risk_distribution = self._calculate_risk_distribution(risk_factors)
         
         # Generate vulnerabilities
-        vulnerabilities = self.identify_vulnerabilities(content, tags)
+        vulnerabilities = self._find_vulnerabilities(content, content_lower, hits, tags)
         
         # Generate recommendations
         recommendations = self._generate_recommendations(primary_risks, tags)
         
-        return RiskAssessment(
+        assessment = RiskAssessment(
             overall_score=overall_score,
             primary_risks=primary_risks,
             vulnerabilities=vulnerabilities,
             risk_distribution=risk_distribution,
             recommendations=recommendations
         )
-    
-    def _assess_category_risk(self, content: str, category: RiskCategory, tags: List[str]) -> List[RiskFactor]:
-        """Assess risks for a specific category."""
-        risks = []
-        
-        if category == RiskCategory.FINANCIAL:
-            risks.extend(self._assess_financial_risks(content, tags))
-        elif category == RiskCategory.LEGAL:
-            risks.extend(self._assess_legal_risks(content, tags))
-        elif category == RiskCategory.OPERATIONAL:
-            risks.extend(self._assess_operational_risks(content, tags))
-        elif category == RiskCategory.COMPLIANCE:
-            risks.extend(self._assess_compliance_risks(content, tags))
-        elif category == RiskCategory.REPUTATIONAL:
-            risks.extend(self._assess_reputational_risks(content, tags))
-        elif category == RiskCategory.STRATEGIC:
-            risks.extend(self._assess_strategic_risks(content, tags))
-        
-        return risks
-    
-    def _assess_financial_risks(self, content: str, tags: List[str]) -> List[RiskFactor]:
-        """Assess financial risks in clause content."""
-        risks = []
-        content_lower = content.lower()
-        
-        # Payment delay risks
-        if 'payment' in content_lower and ('penalty' not in content_lower or 'interest' not in content_lower):
-            risks.append(RiskFactor(
-                category=RiskCategory.FINANCIAL,
-                description="Payment terms lack penalty provisions for late payment",
-                severity=6.0,
-                likelihood=0.3,
-                impact="Potential cash flow issues and collection difficulties"
-            ))
-        
-        # Unlimited liability exposure
-        if 'liable' in content_lower and 'limit' not in content_lower:
-            risks.append(RiskFactor(
-                category=RiskCategory.FINANCIAL,
-                description="Unlimited liability exposure without caps",
-                severity=8.0,
-                likelihood=0.2,
-                impact="Potentially catastrophic financial exposure"
-            ))
-        
-        # Currency risk
-        if any(curr in content_lower for curr in ['currency', 'exchange', 'usd', 'eur']):
-            if 'hedg' not in content_lower and 'fix' not in content_lower:
-                risks.append(RiskFactor(
-                    category=RiskCategory.FINANCIAL,
-                    description="Currency exchange rate risk without hedging",
-                    severity=5.0,
-                    likelihood=0.4,
-                    impact="Potential financial losses from rate fluctuations"
-                ))
-        
-        # Penalty assessment
-        penalty_match = re.search(r'(\\d+)%.*penalty', content_lower)
-        if penalty_match:
-            penalty_rate = float(penalty_match.group(1))
-            if penalty_rate > 5:
-                risks.append(RiskFactor(
-                    category=RiskCategory.FINANCIAL,
-                    description=f"High penalty rate of {penalty_rate}% may be excessive",
-                    severity=7.0,
-                    likelihood=0.3,
-                    impact="Disproportionate financial penalties"
-                ))
-        
-        return risks
-    
-    def _assess_legal_risks(self, content: str, tags: List[str]) -> List[RiskFactor]:
-        """Assess legal risks in clause content."""
-        risks = []
-        content_lower = content.lower()
-        
-        # Jurisdiction issues
-        if 'jurisdiction' in content_lower:
-            unfavorable_jurisdictions = ['foreign', 'offshore', 'international arbitration']
-            if any(unfav in content_lower for unfav in unfavorable_jurisdictions):
-                risks.append(RiskFactor(
-                    category=RiskCategory.LEGAL,
-                    description="Potentially unfavorable jurisdiction for dispute resolution",
-                    severity=7.0,
-                    likelihood=0.2,
-                    impact="Increased legal costs and procedural disadvantages"
-                ))
-        
-        # Indemnification gaps
-        if 'indemnif' in content_lower:
-            if 'mutual' not in content_lower and 'reciprocal' not in content_lower:
-                risks.append(RiskFactor(
-                    category=RiskCategory.LEGAL,
-                    description="One-sided indemnification obligations",
-                    severity=6.5,
-                    likelihood=0.3,
-                    impact="Asymmetric legal protection and liability exposure"
-                ))
-        
-        # Broad warranty language
-        if any(term in content_lower for term in ['warrant', 'guarantee']) and 'disclaim' not in content_lower:
-            risks.append(RiskFactor(
-                category=RiskCategory.LEGAL,
-                description="Broad warranty obligations without disclaimers",
-                severity=5.5,
-                likelihood=0.4,
-                impact="Potential warranty claims and associated costs"
-            ))
-        
-        # Termination imbalance
-        if 'terminat' in content_lower:
-            if 'convenience' in content_lower and 'cure' not in content_lower:
-                risks.append(RiskFactor(
-                    category=RiskCategory.LEGAL,
-                    description="Termination for convenience without cure period",
-                    severity=6.0,
-                    likelihood=0.25,
-                    impact="Risk of abrupt contract termination"
-                ))
-        
-        return risks
-    
-    def _assess_operational_risks(self, content: str, tags: List[str]) -> List[RiskFactor]:
-        """Assess operational risks in clause content."""
-        risks = []
-        content_lower = content.lower()
         
-        # Unrealistic timelines
-        timeline_patterns = [
-            (r'(\\d+)\\s*days?', 'days'),
-            (r'(\\d+)\\s*hours?', 'hours'),
-            (r'(\\d+)\\s*weeks?', 'weeks')
-        ]
-        
-        for pattern, unit in timeline_patterns:
-            matches = re.findall(pattern, content_lower)
-            for match in matches:
-                days = int(match)
-                if unit == 'hours':
-                    days = days / 24
-                elif unit == 'weeks':
-                    days = days * 7
-                
-                if days < 3:  # Very tight timeline
-                    risks.append(RiskFactor(
-                        category=RiskCategory.OPERATIONAL,
-                        description=f"Tight timeline of {match} {unit} may be unrealistic",
-                        severity=5.0,
-                        likelihood=0.5,
-                        impact="Risk of delivery delays and penalty exposure"
-                    ))
-        
-        # Scope definition issues
-        if 'deliverable' in content_lower and 'specific' not in content_lower:
-            risks.append(RiskFactor(
-                category=RiskCategory.OPERATIONAL,
-                description="Vague deliverable specifications may lead to scope disputes",
-                severity=6.0,
-                likelihood=0.4,
-                impact="Scope creep and delivery disagreements"
-            ))
-        
-        # Dependency risks
-        if 'depend' in content_lower or 'third party' in content_lower:
-            risks.append(RiskFactor(
-                category=RiskCategory.OPERATIONAL,
-                description="Third-party dependencies create operational risks",
-                severity=4.5,
-                likelihood=0.3,
-                impact="Potential delays due to external factors"
-            ))
+        with self._cache_lock:
+            self._assessment_cache[cache_key] = assessment
+            if len(self._assessment_cache) > _ASSESSMENT_CACHE_SIZE:
+                self._assessment_cache.popitem(last=False)
         
-        return risks
+        return assessment
     
-    def _assess_compliance_risks(self, content: str, tags: List[str]) -> List[RiskFactor]:
-        """Assess compliance risks in clause content."""
-        risks = []
-        content_lower = content.lower()
-        
-        # Regulatory compliance gaps
-        if any(reg in content_lower for reg in ['regulation', 'compliance', 'law']) and 'current' not in content_lower:
-            risks.append(RiskFactor(
-                category=RiskCategory.COMPLIANCE,
-                description="Compliance obligations may not reflect current regulations",
-                severity=6.5,
-                likelihood=0.3,
-                impact="Regulatory violations and associated penalties"
-            ))
-        
-        # Data protection issues
-        if 'data' in content_lower and 'gdpr' not in content_lower and 'privacy' not in content_lower:
-            risks.append(RiskFactor(
-                category=RiskCategory.COMPLIANCE,
-                description="Data handling without explicit privacy protections",
-                severity=7.0,
-                likelihood=0.4,
-                impact="Privacy violations and regulatory fines"
-            ))
-        
-        # AML/CTF compliance
-        if any(fin in content_lower for fin in ['payment', 'financial', 'money']) and 'aml' not in content_lower:
-            risks.append(RiskFactor(
-                category=RiskCategory.COMPLIANCE,
-                description="Financial operations without AML/CTF compliance measures",
-                severity=5.5,
-                likelihood=0.2,
-                impact="Anti-money laundering compliance issues"
-            ))
-        
-        return risks
-    
-    def _assess_reputational_risks(self, content: str, tags: List[str]) -> List[RiskFactor]:
-        """Assess reputational risks in clause content."""
-        risks = []
-        content_lower = content.lower()
-        
-        # Public disclosure risks
-        if 'public' in content_lower or 'disclosure' in content_lower:
-            if 'confidential' not in content_lower:
-                risks.append(RiskFactor(
-                    category=RiskCategory.REPUTATIONAL,
-                    description="Public disclosure without confidentiality protections",
-                    severity=5.0,
-                    likelihood=0.3,
-                    impact="Potential reputation damage from public exposure"
-                ))
-        
-        # Quality standards
-        if 'quality' in content_lower and 'standard' not in content_lower:
-            risks.append(RiskFactor(
-                category=RiskCategory.REPUTATIONAL,
-                description="Quality expectations without defined standards",
-                severity=4.0,
-                likelihood=0.4,
-                impact="Risk of quality disputes affecting reputation"
-            ))
-        
-        return risks
+    @staticmethod
+    def _assessment_key(content: str, tags: List[str]) -> tuple:
+        """Build the cache key for a clause; tags only matter by membership."""
+        digest = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        return digest, frozenset(tags)
     
-    def _assess_strategic_risks(self, content: str, tags: List[str]) -> List[RiskFactor]:
-        """Assess strategic risks in clause content."""
-        risks = []
-        content_lower = content.lower()
-        
-        # IP strategy risks
-        if 'intellectual property' in content_lower or 'copyright' in content_lower:
-            if 'license back' not in content_lower and 'retain' not in content_lower:
-                risks.append(RiskFactor(
-                    category=RiskCategory.STRATEGIC,
-                    description="IP transfer without license-back rights",
-                    severity=7.5,
-                    likelihood=0.2,
-                    impact="Loss of strategic IP assets and future licensing opportunities"
-                ))
-        
-        # Exclusivity concerns
-        if 'exclusive' in content_lower and 'term' not in content_lower:
-            risks.append(RiskFactor(
-                category=RiskCategory.STRATEGIC,
-                description="Indefinite exclusivity arrangements",
-                severity=6.0,
-                likelihood=0.25,
-                impact="Strategic flexibility limitations"
-            ))
-        
-        return risks
+    def _cached_assessment(self, cache_key: tuple) -> Optional[RiskAssessment]:
+        """Return a cached assessment and mark it recently used, or None on a miss."""
+        with self._cache_lock:
+            assessment = self._assessment_cache.get(cache_key)
+            if assessment is not None:
+                self._assessment_cache.move_to_end(cache_key)
+        return assessment
     
-    def _check_tag_specific_vulnerabilities(self, content: str, tags: List[str]) -> List[str]:
-        """Check for vulnerabilities specific to clause tags."""
+    def _check_tag_specific_vulnerabilities(self, hits: FrozenSet[str], tags: List[str]) -> List[str]:
+        """Check for vulnerabilities specific to clause tags given its risk keyword hits."""
         vulnerabilities = []
-        content_lower = content.lower()
         
         if 'FIN' in tags:
-            if 'payment' in content_lower and 'escrow' not in content_lower:
+            if 'payment' in hits and 'escrow' not in hits:
                 vulnerabilities.append("Financial: No escrow protection for payments")
-            if 'penalty' in content_lower and 'cap' not in content_lower:
+            if 'penalty' in hits and 'cap' not in hits:
                 vulnerabilities.append("Financial: Uncapped penalty exposure")
         
         if 'TEC' in tags:
-            if 'sla' in content_lower and 'remedy' not in content_lower:
+            if 'sla' in hits and 'remedy' not in hits:
                 vulnerabilities.append("Technical: SLA without enforcement remedies")
-            if 'deliverable' in content_lower and 'acceptance' not in content_lower:
+            if 'deliverable' in hits and 'acceptance' not in hits:
                 vulnerabilities.append("Technical: No formal acceptance criteria")
         
         if 'LEG' in tags:
-            if 'liability' in content_lower and 'insurance' not in content_lower:
+            if 'liability' in hits and 'insurance' not in hits:
                 vulnerabilities.append("Legal: Liability exposure without insurance requirements")
         
         return vulnerabilities
@@ -437,15 +534,14 @@ class RiskAssessor:
         if not risk_factors:
             return 1.0  # Minimal risk baseline
         
-        # Weight by severity and likelihood
-        weighted_scores = []
-        for factor in risk_factors:
-            weighted_score = factor.severity * factor.likelihood
-            category_weight = self.risk_weights.get(factor.category, 1.0)
-            weighted_scores.append(weighted_score * category_weight)
-        
-        # Aggregate using root mean square to avoid overweighting
-        total_score = (sum(score ** 2 for score in weighted_scores) / len(weighted_scores)) ** 0.5
+        # Weight by severity, likelihood and category, aggregating using
+        # root mean square to avoid overweighting
+        weights = self.risk_weights
+        sum_of_squares = sum(
+            (factor.severity * factor.likelihood * weights.get(factor.category, 1.0)) ** 2
+            for factor in risk_factors
+        )
+        total_score = (sum_of_squares / len(risk_factors)) ** 0.5
         return min(total_score, 10.0)  # Cap at 10
     
     def _calculate_risk_distribution(self, risk_factors: List[RiskFactor]) -> Dict[RiskCategory, float]:
@@ -455,14 +551,15 @@ class RiskAssessor:
         if not risk_factors:
             return distribution
         
-        category_scores = {}
+        # Accumulate per-category totals and counts in a single pass
+        counts = dict.fromkeys(distribution, 0)
         for factor in risk_factors:
-            if factor.category not in category_scores:
-                category_scores[factor.category] = []
-            category_scores[factor.category].append(factor.severity * factor.likelihood)
+            distribution[factor.category] += factor.severity * factor.likelihood
+            counts[factor.category] += 1
         
-        for category, scores in category_scores.items():
-            distribution[category] = sum(scores) / len(scores)
+        for category, count in counts.items():
+            if count:
+                distribution[category] /= count
         
         return distribution
     
@@ -484,70 +581,6 @@ class RiskAssessor:
             recommendations.append("Legal: Review indemnification and liability provisions")
         
         return recommendations
-    
-    def _build_risk_patterns(self) -> Dict[str, List[str]]:
-        """Build patterns for risk detection."""
-        return {
-            'high_risk_terms': [
-                'unlimited liability', 'personal guarantee', 'joint and several',
-                'in perpetuity', 'irrevocable', 'unconditional'
-            ],
-            'financial_risks': [
-                'penalty', 'liquidated damages', 'late fee', 'interest',
-                'collection costs', 'attorney fees'
-            ],
-            'legal_risks': [
-                'indemnification', 'hold harmless', 'breach', 'default',
-                'termination', 'injunctive relief'
-            ]
-        }
-    
-    def _build_vulnerability_indicators(self) -> Dict[str, List[str]]:
-        """Build indicators for vulnerability detection."""
-        return {
-            'asymmetric_terms': [
-                'solely responsible', 'exclusively liable', 'bears all costs',
-                'at own expense', 'without recourse'
-            ],
-            'vague_language': [
-                'reasonable efforts', 'best efforts', 'commercially reasonable',
-                'appropriate measures', 'satisfactory performance'
-            ],
-            'missing_protections': [
-                'without warranty', 'as is', 'no guarantee',
-                'disclaim all liability', 'exclude all warranties'
-            ]
-        }
-    
-    def _build_risk_weights(self) -> Dict[RiskCategory, float]:
-        """Build weighting factors for different risk categories."""
-        return {
-            RiskCategory.FINANCIAL: 1.2,
-            RiskCategory.LEGAL: 1.1,
-            RiskCategory.OPERATIONAL: 0.9,
-            RiskCategory.COMPLIANCE: 1.0,
-            RiskCategory.REPUTATIONAL: 0.8,
-            RiskCategory.STRATEGIC: 1.0
-        }
-    
-    def _build_mitigation_strategies(self) -> Dict[RiskCategory, Dict[str, str]]:
-        """Build mitigation strategies for common risks."""
-        return {
-            RiskCategory.FINANCIAL: {
-                "Payment terms lack penalty provisions": "Add late payment penalties and interest charges",
-                "Unlimited liability exposure": "Insert liability caps and limitations",
-                "Currency exchange rate risk": "Include currency hedging or fixed rate provisions"
-            },
-            RiskCategory.LEGAL: {
-                "One-sided indemnification": "Negotiate mutual indemnification provisions",
-                "Unfavorable jurisdiction": "Seek neutral jurisdiction or alternative dispute resolution",
-                "Broad warranty obligations": "Add warranty disclaimers and limitations"
-            },
-            RiskCategory.OPERATIONAL: {
-                "Tight timeline": "Request realistic deadlines with force majeure protection",
-                "Vague deliverable specifications": "Demand detailed specifications and acceptance criteria"
-            }
-        }
 
 
 def main():
@@ -8,32 +8,59 @@ Licensed under MIT License
 """
 
 import sys
+import importlib
 from pathlib import Path
 from typing import Optional
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
 
-# Add project root to path
-PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+# Add project root to path when run directly as a script; the installed
+# neex-review entry point and ``python -m src.cli.main`` already have it
+if __name__ == "__main__" and not __package__:
+    PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.core.review_orchestrator import ReviewOrchestrator
-from src.core.contract_parser import ContractParser
-from src.config import load_config
+# Heavy dependencies (rich, pydantic via src.config, the document parsers and
+# analysis stack) are imported on first use so that --help and other light
+# commands start quickly. Each name is bound here once imported.
+_LAZY_IMPORTS = {
+    "ReviewOrchestrator": ("src.core.review_orchestrator", "ReviewOrchestrator"),
+    "ContractParser": ("src.core.contract_parser", "ContractParser"),
+    "load_config": ("src.config", "load_config"),
+}
+ReviewOrchestrator = None
+ContractParser = None
+load_config = None
 
-console = Console()
+console = None
+
+
+def _require(*names: str) -> None:
+    """Import the named heavy dependencies into this module if not yet bound."""
+    module_globals = globals()
+    for name in names:
+        if module_globals[name] is None:
+            module_name, attribute = _LAZY_IMPORTS[name]
+            module_globals[name] = getattr(importlib.import_module(module_name), attribute)
+
+
+def _get_console():
+    """Return the shared rich console, creating it on first use."""
+    global console
+    if console is None:
+        from rich.console import Console
+        console = Console()
+    return console
 
 
 @click.group()
 @click.version_option(version="1.0.0", prog_name="neex-review")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose output")
-@click.option("--config", "-c", type=click.Path(exists=True), help="Custom config file path")
+@click.option("--config", "-c", type=click.Path(exists=True, path_type=Path),
+              help="Custom config file path")
 @click.pass_context
-def cli(ctx: click.Context, verbose: bool, config: Optional[str]) -> None:
+def cli(ctx: click.Context, verbose: bool, config: Optional[Path]) -> None:
     """
     NEEX Legal Contract Review System
     
@@ -46,13 +73,14 @@ def cli(ctx: click.Context, verbose: bool, config: Optional[str]) -> None:
     ctx.obj["config_path"] = config
     
     if verbose:
+        console = _get_console()
         console.print("[bold blue]NEEX Legal Review System v1.0.0[/bold blue]")
         console.print("Initializing AI-powered contract analysis...")
 
 
 @cli.command()
-@click.argument("contract_file", type=click.Path(exists=True))
-@click.option("--output", "-o", type=click.Path(), help="Output directory for reports")
+@click.argument("contract_file", type=click.Path(exists=True, path_type=Path))
+@click.option("--output", "-o", type=click.Path(path_type=Path), help="Output directory for reports")
 @click.option("--format", "-f", type=click.Choice(["html", "pdf", "markdown", "json"]), 
               default="html", help="Output format for reports")
 @click.option("--pause-checkpoints", "-p", is_flag=True, default=True, 
@@ -60,7 +88,7 @@ def cli(ctx: click.Context, verbose: bool, config: Optional[str]) -> None:
 @click.option("--clause-limit", type=int, help="Limit analysis to specific number of clauses")
 @click.option("--tags", multiple=True, help="Filter analysis by specific clause tags")
 @click.pass_context
-def analyze(ctx: click.Context, contract_file: str, output: Optional[str], 
+def analyze(ctx: click.Context, contract_file: Path, output: Optional[Path], 
            format: str, pause_checkpoints: bool, clause_limit: Optional[int],
            tags: tuple) -> None:
     """
@@ -75,6 +103,12 @@ def analyze(ctx: click.Context, contract_file: str, output: Optional[str],
     Example:
         neex-review analyze contract.pdf --output ./reports --format html
     """
+    from rich.console import Group
+    from rich.panel import Panel
+    
+    console = _get_console()
+    _require("load_config", "ContractParser", "ReviewOrchestrator")
+    
     try:
         config = load_config(ctx.obj.get("config_path"))
         
@@ -105,7 +139,7 @@ def analyze(ctx: click.Context, contract_file: str, output: Optional[str],
         )
         
         # Generate reports
-        output_dir = Path(output) if output else Path.cwd() / "neex_reports"
+        output_dir = output if output else Path.cwd() / "neex_reports"
         output_dir.mkdir(parents=True, exist_ok=True)
         
         with console.status("[bold blue]Generating reports..."):
@@ -115,22 +149,22 @@ def analyze(ctx: click.Context, contract_file: str, output: Optional[str],
                 format=format
             )
         
-        console.print("\n[bold green]✓ Analysis Complete![/bold green]")
-        console.print("\n[bold]Reports generated:[/bold]")
-        for file_path in report_files:
-            console.print(f"  📄 {file_path}")
-        
-        # Display summary
+        # Display completion, report files and summary in a single print
         summary = review_results.get_summary()
-        console.print(Panel(
-            f"[bold]Issues Found:[/bold]\n"
-            f"• Critical: {summary['critical_issues']}\n"
-            f"• Material: {summary['material_issues']}\n"
-            f"• Procedural: {summary['procedural_issues']}\n\n"
-            f"[bold]Negotiation Opportunities:[/bold] {summary['negotiation_items']}\n"
-            f"[bold]Clauses Analyzed:[/bold] {summary['total_clauses']}",
-            title="Analysis Summary",
-            border_style="green"
+        console.print(Group(
+            "\n[bold green]✓ Analysis Complete![/bold green]",
+            "\n[bold]Reports generated:[/bold]",
+            *[f"  📄 {file_path}" for file_path in report_files],
+            Panel(
+                f"[bold]Issues Found:[/bold]\n"
+                f"• Critical: {summary['critical_issues']}\n"
+                f"• Material: {summary['material_issues']}\n"
+                f"• Procedural: {summary['procedural_issues']}\n\n"
+                f"[bold]Negotiation Opportunities:[/bold] {summary['negotiation_items']}\n"
+                f"[bold]Clauses Analyzed:[/bold] {summary['total_clauses']}",
+                title="Analysis Summary",
+                border_style="green"
+            )
         ))
         
     except Exception as e:
@@ -141,13 +175,18 @@ def analyze(ctx: click.Context, contract_file: str, output: Optional[str],
 
 
 @cli.command()
-@click.argument("config_file", type=click.Path(exists=True))
-def validate_config(config_file: str) -> None:
+@click.argument("config_file", type=click.Path(exists=True, path_type=Path))
+def validate_config(config_file: Path) -> None:
     """
     Validate a NEEX configuration file.
     
     Checks YAML syntax, required fields, and blueprint compliance.
     """
+    from rich.panel import Panel
+    
+    console = _get_console()
+    _require("load_config")
+    
     try:
         config = load_config(config_file)
         console.print(f"[bold green]✓ Configuration valid:[/bold green] {config_file}")
@@ -175,40 +214,57 @@ def info(clause_tags: bool, risk_levels: bool, templates: bool) -> None:
     """
     Display information about the NEEX system capabilities.
     """
-    config = load_config()
+    from rich.console import Group
+    from rich.panel import Panel
+    
+    console = _get_console()
+    _require("load_config")
+    
+    # With no section flags, every section is shown
+    show_all = not (clause_tags or risk_levels or templates)
     
-    if clause_tags or not any([clause_tags, risk_levels, templates]):
+    # Only the templates section needs more than blueprint.yaml
+    config = load_config(blueprint_only=not (templates or show_all))
+    panels = []
+    
+    if clause_tags or show_all:
         tags = config.get("clause_tagging_system", {}).get("tags", {})
-        console.print(Panel(
+        panels.append(Panel(
             "\n".join([f"[bold]{tag}:[/bold] {desc}" for tag, desc in tags.items()]),
             title="Available Clause Tags"
         ))
     
-    if risk_levels or not any([clause_tags, risk_levels, templates]):
-        console.print(Panel(
+    if risk_levels or show_all:
+        panels.append(Panel(
             "[bold red]Critical:[/bold red] Significant financial/legal/business risk\n"
             "[bold yellow]Material:[/bold yellow] Moderate impact on operations\n"
             "[bold blue]Procedural:[/bold blue] Administrative or process issues",
             title="Risk Assessment Levels"
         ))
     
-    if templates or not any([clause_tags, risk_levels, templates]):
+    if templates or show_all:
         templates_list = list(config.get("report_templates", {}).keys())
-        console.print(Panel(
+        panels.append(Panel(
             "\n".join([f"• {template}" for template in templates_list]),
             title="Available Report Templates"
         ))
+    
+    # Render all sections in a single print
+    console.print(Group(*panels))
 
 
 @cli.command()
-@click.argument("contract_file", type=click.Path(exists=True))
+@click.argument("contract_file", type=click.Path(exists=True, path_type=Path))
 @click.option("--clauses-only", is_flag=True, help="Extract clauses without analysis")
-def extract(contract_file: str, clauses_only: bool) -> None:
+def extract(contract_file: Path, clauses_only: bool) -> None:
     """
     Extract and display contract structure without full analysis.
     
     Useful for quick document inspection and clause identification.
     """
+    console = _get_console()
+    _require("ContractParser")
+    
     try:
         parser = ContractParser()
         
@@ -218,13 +274,18 @@ def extract(contract_file: str, clauses_only: bool) -> None:
         console.print(f"\n[bold]Document:[/bold] {contract_file}")
         console.print(f"[bold]Total Clauses:[/bold] {len(contract_data.clauses)}\n")
         
+        # Render the clause listing in a single print; per-call rendering
+        # overhead dominates for contracts with many clauses
+        lines = []
         for i, clause in enumerate(contract_data.clauses, 1):
-            console.print(f"[bold]{i}.[/bold] {clause.title}")
+            lines.append(f"[bold]{i}.[/bold] {clause.title}")
             if not clauses_only:
-                console.print(f"   [dim]Preview:[/dim] {clause.content[:100]}...")
+                lines.append(f"   [dim]Preview:[/dim] {clause.content[:100]}...")
                 if clause.auto_tags:
-                    console.print(f"   [dim]Tags:[/dim] {', '.join(clause.auto_tags)}")
-            console.print()
+                    lines.append(f"   [dim]Tags:[/dim] {', '.join(clause.auto_tags)}")
+            lines.append("")
+        if lines:
+            console.print("\n".join(lines))
             
     except Exception as e:
         console.print(f"[bold red]Extraction error:[/bold red] {str(e)}")
@@ -9,10 +9,27 @@ Licensed under MIT License
 """
 
 import os
+import copy
+import functools
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field, validator
+from typing import Dict, Any, Optional, Tuple, Union
+from pydantic import BaseModel, Field, field_validator
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Review dimensions every blueprint must define
+_REQUIRED_DIMENSIONS = frozenset({
+    'technical_scope', 'legal_protections', 'financial_commercials', 'compliance_standards'
+})
+
+# Clause tags every tagging system must define
+_REQUIRED_TAGS = frozenset({'TEC', 'LEG', 'FIN', 'COM', 'IPX', 'TRM', 'DIS', 'DOC', 'EXE', 'EXT'})
 
 
 class BlueprintConfig(BaseModel):
@@ -40,59 +57,107 @@ class ExecutionalFlowConfig(BaseModel):
     end_of_review_appendices: Dict[str, Any]
 
 
-class NEEXConfig(BaseModel):
-    """Main NEEX configuration model."""
+class BlueprintFileConfig(BaseModel):
+    """Configuration model for the sections defined in blueprint.yaml."""
     neex_legal_contract_review_blueprint: BlueprintConfig
     clause_tagging_system: ClauseTaggingConfig
     modular_clause_checklist: Dict[str, Any]
     executional_flow: ExecutionalFlowConfig
-    clause_categories: Optional[Dict[str, Any]] = None
-    risk_assessment: Optional[Dict[str, Any]] = None
-    negotiation_strategies: Optional[Dict[str, Any]] = None
-    report_templates: Optional[Dict[str, Any]] = None
-    email_templates: Optional[Dict[str, Any]] = None
-    cli_templates: Optional[Dict[str, Any]] = None
 
-    @validator('neex_legal_contract_review_blueprint')
+    @field_validator('neex_legal_contract_review_blueprint')
+    @classmethod
     def validate_blueprint(cls, v):
         """Validate blueprint configuration."""
-        required_dimensions = ['technical_scope', 'legal_protections', 
-                             'financial_commercials', 'compliance_standards']
-        if not all(dim in v.review_dimensions for dim in required_dimensions):
-            raise ValueError(f"Missing required review dimensions: {required_dimensions}")
+        missing = _REQUIRED_DIMENSIONS - v.review_dimensions.keys()
+        if missing:
+            raise ValueError(f"Missing required review dimensions: {sorted(missing)}")
         return v
 
-    @validator('clause_tagging_system')
+    @field_validator('clause_tagging_system')
+    @classmethod
     def validate_tagging_system(cls, v):
         """Validate clause tagging system."""
-        required_tags = ['TEC', 'LEG', 'FIN', 'COM', 'IPX', 'TRM', 'DIS', 'DOC', 'EXE', 'EXT']
-        if not all(tag in v.tags for tag in required_tags):
-            raise ValueError(f"Missing required clause tags: {required_tags}")
+        missing = _REQUIRED_TAGS - v.tags.keys()
+        if missing:
+            raise ValueError(f"Missing required clause tags: {sorted(missing)}")
         return v
 
 
+class NEEXConfig(BlueprintFileConfig):
+    """Main NEEX configuration model."""
+    clause_categories: Optional[Dict[str, Any]] = None
+    risk_assessment: Optional[Dict[str, Any]] = None
+    negotiation_strategies: Optional[Dict[str, Any]] = None
+    report_templates: Optional[Dict[str, Any]] = None
+    email_templates: Optional[Dict[str, Any]] = None
+    cli_templates: Optional[Dict[str, Any]] = None
+
+
 def get_config_dir() -> Path:
     """Get the configuration directory path."""
     return Path(__file__).parent / "config"
 
 
+# Parsed YAML files by absolute path, with the (mtime_ns, size) they were read at
+_YAML_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
 def load_yaml_file(file_path: Path) -> Dict[str, Any]:
-    """Load a YAML file and return its contents."""
+    """
+    Load a YAML file and return its contents.
+    
+    Parsed files are cached for the life of the process and only re-read
+    when their modification time or size changes. Each caller receives its
+    own copy of the data.
+    """
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {file_path}")
+    
+    key = os.path.abspath(file_path)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return copy.deepcopy(cached[2])
+    
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file) or {}
+        data = yaml.load(Path(file_path).read_bytes(), Loader=_YamlLoader) or {}
     except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {file_path}")
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML in {file_path}: {e}")
+    
+    _YAML_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data)
+    return copy.deepcopy(data)
+
+
+# Validated configurations by (config directory, blueprint_only), with the
+# signatures of the files they were built from
+_CONFIG_CACHE: Dict[Tuple[str, bool], Tuple[tuple, Dict[str, Any]]] = {}
+
 
+def _file_signature(file_path: Path) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it does not exist."""
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
-def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
+
+def load_config(config_path: Optional[Union[str, Path]] = None,
+                blueprint_only: bool = False) -> Dict[str, Any]:
     """
     Load the complete NEEX configuration from YAML files.
     
+    The validated configuration is cached per config directory and rebuilt
+    only when one of its files changes. Each caller receives its own copy.
+    
     Args:
         config_path: Optional path to a custom config directory or file
+        blueprint_only: Load and validate only blueprint.yaml (blueprint,
+            clause tags, checklist and executional flow), skipping the
+            clause definition and template files
         
     Returns:
         Complete configuration dictionary
@@ -120,6 +185,15 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     clause_defs_path = config_dir / "clause_definitions.yaml"
     templates_path = config_dir / "review_templates.yaml"
     
+    config_files = (blueprint_path,) if blueprint_only else (
+        blueprint_path, clause_defs_path, templates_path
+    )
+    cache_key = (os.path.abspath(config_dir), blueprint_only)
+    signature = tuple(_file_signature(path) for path in config_files)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return copy.deepcopy(cached[1])
+    
     # Load and merge configurations
     config = {}
     
@@ -127,26 +201,38 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     config.update(load_yaml_file(blueprint_path))
     
     # Load clause definitions (optional, enhances blueprint)
-    if clause_defs_path.exists():
+    if not blueprint_only and clause_defs_path.exists():
         clause_config = load_yaml_file(clause_defs_path)
         config.update(clause_config)
     
     # Load templates (optional)
-    if templates_path.exists():
+    if not blueprint_only and templates_path.exists():
         template_config = load_yaml_file(templates_path)
         config.update(template_config)
     
     # Validate configuration
+    model = BlueprintFileConfig if blueprint_only else NEEXConfig
     try:
-        validated_config = NEEXConfig(**config)
-        return validated_config.dict()
+        validated_config = model.model_validate(config).model_dump()
     except Exception as e:
         raise ValueError(f"Configuration validation failed: {e}")
+    
+    _CONFIG_CACHE[cache_key] = (signature, validated_config)
+    return copy.deepcopy(validated_config)
+
+
+def _clear_config_caches() -> None:
+    """Drop all cached YAML files and validated configurations."""
+    _YAML_CACHE.clear()
+    _CONFIG_CACHE.clear()
+
+
+load_config.cache_clear = _clear_config_caches
 
 
 def get_clause_tags() -> Dict[str, str]:
     """Get the available clause tags and their descriptions."""
-    config = load_config()
+    config = load_config(blueprint_only=True)
     return config["clause_tagging_system"]["tags"]
 
 
@@ -181,8 +267,9 @@ def validate_config_file(config_path: str) -> tuple[bool, str]:
 
 
 # Environment variable configuration
-def get_env_config() -> Dict[str, Any]:
-    """Get configuration from environment variables."""
+@functools.lru_cache(maxsize=1)
+def _parse_env_config() -> Dict[str, Any]:
+    """Read and parse the environment variable configuration."""
     return {
         "debug": os.getenv("NEEX_DEBUG", "false").lower() == "true",
         "log_level": os.getenv("NEEX_LOG_LEVEL", "INFO"),
@@ -195,6 +282,19 @@ def get_env_config() -> Dict[str, Any]:
     }
 
 
+def get_env_config() -> Dict[str, Any]:
+    """
+    Get configuration from environment variables.
+    
+    The environment is parsed once per process; call
+    get_env_config.cache_clear() after changing the variables.
+    """
+    return dict(_parse_env_config())
+
+
+get_env_config.cache_clear = _parse_env_config.cache_clear
+
+
 # Export main functions
 __all__ = [
     "load_config",
@@ -6,15 +6,24 @@ Defines the central data structure that flows through the analysis pipeline.
 Accumulates results from each processing stage.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
 from .contract_parser import ContractDocument, Clause
-from .clause_analyzer import ClauseAnalysis
+from .clause_analyzer import ClauseAnalysis, RiskLevel
 
 
-@dataclass
+# Summary key reporting the number of clauses at each risk level
+_RISK_SUMMARY_KEYS = {
+    RiskLevel.CRITICAL: "critical_issues",
+    RiskLevel.MATERIAL: "material_issues",
+    RiskLevel.PROCEDURAL: "procedural_issues",
+}
+
+
+@dataclass(slots=True)
 class AnalysisContext:
     """
     Central context object that flows through the ReviewOrchestrator pipeline.
@@ -69,19 +78,13 @@ class AnalysisContext:
         if not self.contract_document:
             return {"status": "error", "message": "No contract document parsed"}
         
-        critical_issues = sum(1 for analysis in self.clause_analyses 
-                            if analysis.risk_level.value == "Critical")
-        material_issues = sum(1 for analysis in self.clause_analyses 
-                            if analysis.risk_level.value == "Material")
-        procedural_issues = sum(1 for analysis in self.clause_analyses 
-                              if analysis.risk_level.value == "Procedural")
+        # Count clauses per risk level in a single pass
+        risk_counts = Counter(analysis.risk_level for analysis in self.clause_analyses)
         
         return {
             "status": "completed",
             "total_clauses": len(self.clause_analyses),
-            "critical_issues": critical_issues,
-            "material_issues": material_issues,
-            "procedural_issues": procedural_issues,
+            **{key: risk_counts[level] for level, key in _RISK_SUMMARY_KEYS.items()},
             "negotiation_items": len(self.negotiation_recommendations),
             "overall_risk_score": self.overall_risk_score,
             "processing_time": self.processing_time,
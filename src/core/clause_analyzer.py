@@ -9,10 +9,14 @@ Performs AI-powered analysis of contract clauses according to NEEX blueprint:
 - AI investigatory question generation
 """
 
+import hashlib
 import logging
 import re
+import sys
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 from .contract_parser import Clause
@@ -21,6 +25,18 @@ from ..ai.risk_assessor import RiskAssessor
 
 logger = logging.getLogger(__name__)
 
+# Phrases introducing the mechanism through which a clause operates
+_MECHANISM_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'by means of ([^,\\.]+)',
+    r'through ([^,\\.]+)',
+    r'via ([^,\\.]+)',
+    r'using ([^,\\.]+)',
+    r'pursuant to ([^,\\.]+)'
+))
+
+# Maximum number of clause analyses kept for reuse by identical clauses
+_ANALYSIS_CACHE_SIZE = 4096
+
 
 class RiskLevel(Enum):
     """Risk assessment levels based on NEEX blueprint."""
@@ -29,14 +45,14 @@ class RiskLevel(Enum):
     PROCEDURAL = "Procedural"
 
 
-@dataclass
+@dataclass(slots=True)
 class ClauseAnalysis:
     """
     Comprehensive analysis result for a single clause.
     Based on NEEX blueprint analysis structure.
     """
     clause: Clause
-    tags: List[str] = field(default_factory=list)
+    tags: Tuple[str, ...] = ()
     
     # 3-Layered Analysis Components
     interpretation: str = ""
@@ -59,7 +75,7 @@ class ClauseAnalysis:
     processing_time: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisSession:
     """Tracks analysis progress and manages pause checkpoints."""
     total_clauses: int = 0
@@ -95,10 +111,44 @@ class ClauseAnalyzer:
         
         # Load clause patterns and definitions
         self.clause_definitions = self._load_clause_definitions()
+        
+        # Completed analyses by clause title and content, least recently used first
+        self._analysis_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Tag patterns are compiled on first use and again whenever they change
+        self._tag_snapshot: Tuple = ()
         self.tag_patterns = self._load_tag_patterns()
         
         logger.info("ClauseAnalyzer initialized successfully")
     
+    @property
+    def tag_patterns(self) -> Dict[str, List]:
+        """Keyword (str) and compiled regex patterns per tag."""
+        return self._tag_patterns
+    
+    @tag_patterns.setter
+    def tag_patterns(self, tag_patterns: Dict[str, List]) -> None:
+        """Replace the tag patterns; they are compiled again on next use."""
+        self._tag_patterns = tag_patterns
+        self._tag_matchers = None
+    
+    def _ensure_tag_matchers(self) -> None:
+        """
+        Compile the tag patterns if they were replaced or edited in place
+        since they were last compiled, dropping analyses tagged with the old ones.
+        """
+        snapshot = tuple(
+            (tag, tuple(patterns)) for tag, patterns in self._tag_patterns.items()
+        )
+        if self._tag_matchers is not None and snapshot == self._tag_snapshot:
+            return
+        
+        self._tag_snapshot = snapshot
+        self._tag_matchers = self._compile_tag_patterns(dict(snapshot))
+        with self._cache_lock:
+            self._analysis_cache.clear()
+    
     def analyze_clause(self, clause: Clause) -> ClauseAnalysis:
         """
         Perform comprehensive analysis of a single clause.
@@ -111,13 +161,86 @@ class ClauseAnalyzer:
         """
         logger.debug(f"Analyzing clause {clause.number}: {clause.title}")
         
-        analysis = ClauseAnalysis(clause=clause)
+        self._ensure_tag_matchers()
+        cache_key = self._analysis_key(clause)
+        cached = self._cached_analysis(cache_key)
+        if cached is not None:
+            return self._track_analysis(self._copy_analysis(cached, clause))
         
         # Step 1: Tag Classification
-        analysis.tags = self._classify_clause_tags(clause)
+        tags = self._classify_clause_tags(clause)
+        
+        analysis = self._build_analysis(
+            clause,
+            tags,
+            self._extract_key_terms(clause, tags),
+            self.risk_assessor.assess_risk(clause, tags)
+        )
+        self._store_analysis(cache_key, analysis)
+        return self._track_analysis(analysis)
+    
+    def analyze_clauses(self, clauses: List[Clause]) -> List[ClauseAnalysis]:
+        """
+        Analyze many clauses at once.
+        
+        Key term extraction and risk assessment go through the batch APIs of
+        the NLP processor and risk assessor; the remaining steps run per clause.
+        Clauses analyzed before are served from the analysis cache.
+        
+        Args:
+            clauses: Clause objects to analyze
+            
+        Returns:
+            ClauseAnalysis per clause, in input order, as analyze_clause would return
+        """
+        logger.debug(f"Analyzing batch of {len(clauses)} clauses")
+        
+        self._ensure_tag_matchers()
+        cache_keys = [self._analysis_key(clause) for clause in clauses]
+        analyses = [self._cached_analysis(cache_key) for cache_key in cache_keys]
+        analyses = [
+            self._copy_analysis(cached, clause) if cached is not None else None
+            for cached, clause in zip(analyses, clauses)
+        ]
+        missing = [index for index, analysis in enumerate(analyses) if analysis is None]
+        
+        if missing:
+            pending = [clauses[index] for index in missing]
+            
+            # Step 1: Tag Classification
+            tags_list = [self._classify_clause_tags(clause) for clause in pending]
+            
+            key_terms_list = self.nlp_processor.extract_key_terms_batch(
+                [clause.content for clause in pending], tags_list
+            )
+            risks = self.risk_assessor.assess_risk_batch(pending, tags_list)
+            
+            for index, clause, tags, key_terms, risk in zip(
+                missing, pending, tags_list, key_terms_list, risks
+            ):
+                analyses[index] = self._build_analysis(clause, tags, key_terms, risk)
+                self._store_analysis(cache_keys[index], analyses[index])
+        
+        return [self._track_analysis(analysis) for analysis in analyses]
+    
+    def _build_analysis(self, clause: Clause, tags: Tuple[str, ...], key_terms: List[str],
+                        risk: Tuple[float, List[str]]) -> ClauseAnalysis:
+        """
+        Complete the analysis of a classified clause.
+        
+        Args:
+            clause: Clause being analyzed
+            tags: Assigned clause tags
+            key_terms: Extracted key terms
+            risk: (risk_score, risk_factors) from the risk assessor
+            
+        Returns:
+            Complete ClauseAnalysis with all components
+        """
+        analysis = ClauseAnalysis(clause=clause, tags=tags)
         
         # Step 2: Extract Key Terms
-        analysis.key_scope_terms = self._extract_key_terms(clause, analysis.tags)
+        analysis.key_scope_terms = key_terms
         
         # Step 3: 3-Layered Analysis
         analysis.interpretation = self._analyze_interpretation(clause, analysis.tags)
@@ -125,9 +248,7 @@ class ClauseAnalyzer:
         analysis.opportunity = self._analyze_opportunity(clause, analysis.tags)
         
         # Step 4: Risk Assessment
-        analysis.risk_score, analysis.risk_factors = self.risk_assessor.assess_risk(
-            clause, analysis.tags
-        )
+        analysis.risk_score, analysis.risk_factors = risk
         analysis.risk_level = self._determine_risk_level(analysis.risk_score)
         
         # Step 5: Legal Business Risk Analysis  
@@ -136,15 +257,18 @@ class ClauseAnalyzer:
         )
         
         # Step 6: Negotiation Opportunities (placeholder - will be handled by pipeline)
-        analysis.negotiation_opportunity = self._analyze_opportunity(clause, analysis.tags)
+        analysis.negotiation_opportunity = analysis.opportunity
         
         # Step 7: AI Investigatory Question
         analysis.ai_investigatory_question = self._generate_investigatory_question(
             clause, analysis.tags, analysis.risk_factors
         )
         
-        # Update session tracking
         analysis.token_count = self._estimate_tokens(clause.content)
+        return analysis
+    
+    def _track_analysis(self, analysis: ClauseAnalysis) -> ClauseAnalysis:
+        """Record a completed clause analysis in the session tracking."""
         self.session.processed_clauses += 1
         self.session.session_tokens += analysis.token_count
         self.session.findings_summary[analysis.risk_level.value.lower()] += 1
@@ -152,7 +276,41 @@ class ClauseAnalyzer:
         logger.debug(f"Clause analysis complete: {analysis.risk_level.value} risk")
         return analysis
     
-    def _classify_clause_tags(self, clause: Clause) -> List[str]:
+    @staticmethod
+    def _analysis_key(clause: Clause) -> bytes:
+        """Build the cache key for a clause from the title and content it is analyzed by."""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(clause.title.encode('utf-8', 'surrogatepass'))
+        hasher.update(b'\0')
+        hasher.update(clause.content.encode('utf-8', 'surrogatepass'))
+        return hasher.digest()
+    
+    def _cached_analysis(self, cache_key: bytes) -> Optional[ClauseAnalysis]:
+        """Return a cached analysis and mark it recently used, or None on a miss."""
+        with self._cache_lock:
+            analysis = self._analysis_cache.get(cache_key)
+            if analysis is not None:
+                self._analysis_cache.move_to_end(cache_key)
+        return analysis
+    
+    def _store_analysis(self, cache_key: bytes, analysis: ClauseAnalysis) -> None:
+        """Cache a private copy of an analysis, evicting the least recently used."""
+        with self._cache_lock:
+            self._analysis_cache[cache_key] = self._copy_analysis(analysis, analysis.clause)
+            if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+    
+    @staticmethod
+    def _copy_analysis(analysis: ClauseAnalysis, clause: Clause) -> ClauseAnalysis:
+        """Copy an analysis for another clause, without sharing its list fields."""
+        return replace(
+            analysis,
+            clause=clause,
+            risk_factors=list(analysis.risk_factors),
+            key_scope_terms=list(analysis.key_scope_terms)
+        )
+    
+    def _classify_clause_tags(self, clause: Clause) -> Tuple[str, ...]:
         """
         Classify clause into NEEX categories: TEC/LEG/FIN/COM/IPX/TRM/DIS/DOC/EXE/EXT
         
@@ -160,29 +318,27 @@ class ClauseAnalyzer:
             clause: Clause to classify
             
         Returns:
-            List of applicable tags
+            Tuple of applicable tags
         """
         tags = []
         content_lower = clause.content.lower()
         title_lower = clause.title.lower()
         combined_text = f"{title_lower} {content_lower}"
         
-        # Check each tag category
-        for tag, patterns in self.tag_patterns.items():
-            score = 0
-            for pattern in patterns:
-                if isinstance(pattern, str):
-                    # Simple keyword matching
-                    if pattern.lower() in combined_text:
-                        score += 1
-                else:
-                    # Regex pattern matching
-                    if re.search(pattern, combined_text, re.IGNORECASE):
-                        score += 2
-            
-            # Tag threshold - adjust based on pattern strength
-            if score >= 1:
-                tags.append(tag)
+        self._ensure_tag_matchers()
+        
+        # Check each tag category; any keyword (score 1) or regex (score 2)
+        # hit reaches the tag threshold, so stop at the first match
+        for tag, keywords, regexes in self._tag_matchers:
+            for keyword in keywords:
+                if keyword in combined_text:
+                    tags.append(tag)
+                    break
+            else:
+                for regex in regexes:
+                    if regex.search(combined_text):
+                        tags.append(tag)
+                        break
         
         # Ensure at least one tag is assigned
         if not tags:
@@ -196,7 +352,7 @@ class ClauseAnalyzer:
             else:
                 tags.append('DOC')  # Default to document control
         
-        return tags
+        return tuple(tags)
     
     def _extract_key_terms(self, clause: Clause, tags: List[str]) -> List[str]:
         """
@@ -380,16 +536,8 @@ class ClauseAnalyzer:
         """Extract mechanisms/methods from clause content."""
         mechanisms = []
         
-        mechanism_patterns = [
-            r'by means of ([^,\\.]+)',
-            r'through ([^,\\.]+)',
-            r'via ([^,\\.]+)',
-            r'using ([^,\\.]+)',
-            r'pursuant to ([^,\\.]+)'
-        ]
-        
-        for pattern in mechanism_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for pattern in _MECHANISM_PATTERNS:
+            matches = pattern.findall(content)
             mechanisms.extend([match.strip() for match in matches])
         
         return mechanisms[:3]  # Limit to most relevant
@@ -432,6 +580,31 @@ class ClauseAnalyzer:
         # TODO: Load from clause_definitions.yaml
         return {}
     
+    def _compile_tag_patterns(
+        self, tag_patterns: Dict[str, List]
+    ) -> List[Tuple[str, Tuple[str, ...], Tuple[re.Pattern, ...]]]:
+        """
+        Prepare tag patterns for matching against lowercased clause text.
+        
+        Keywords are lowercased and regex patterns compiled case-insensitively
+        once, rather than on every classification.
+        
+        Args:
+            tag_patterns: Keywords (str) or compiled regex patterns per tag
+            
+        Returns:
+            List of (interned tag, keywords, regexes) in tag order
+        """
+        matchers = []
+        for tag, patterns in tag_patterns.items():
+            keywords = tuple(pattern.lower() for pattern in patterns if isinstance(pattern, str))
+            regexes = tuple(
+                re.compile(pattern.pattern, pattern.flags | re.IGNORECASE)
+                for pattern in patterns if not isinstance(pattern, str)
+            )
+            matchers.append((sys.intern(tag), keywords, regexes))
+        return matchers
+    
     def _load_tag_patterns(self) -> Dict[str, List[str]]:
         """Load tag classification patterns."""
         # Based on clause_definitions.yaml patterns
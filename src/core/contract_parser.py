@@ -8,23 +8,53 @@ Extracts structured clause information for analysis.
 
 import re
 import logging
+import zipfile
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 try:
     import PyPDF2
 except ImportError:
     PyPDF2 = None
 
 try:
-    from docx import Document
+    from lxml import etree
 except ImportError:
-    Document = None
+    etree = None
 
 logger = logging.getLogger(__name__)
 
+# Whitespace around line breaks, including any blank lines in between
+_LINE_BREAK_RE = re.compile(r'[^\S\n]*\n\s*')
+
+# Words whose presence marks an early line as the contract title
+_TITLE_KEYWORD_RE = re.compile(r'AGREEMENT|CONTRACT|SERVICE', re.IGNORECASE)
+
+# Party extraction patterns, tried in order
+_PARTY_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'between\s+([^\n]+?)\s+and\s+([^\n]+?)(?:\.|,|\n)',
+    r'Party\s+A[:\s]+([^\n]+)',
+    r'Party\s+B[:\s]+([^\n]+)'
+))
+
+# WordprocessingML namespace of word/document.xml elements
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+# Text equivalents of non-text run content, as rendered by python-docx
+_DOCX_RUN_SPECIAL_TEXT = {
+    _W_NS + 'tab': '\t',
+    _W_NS + 'ptab': '\t',
+    _W_NS + 'cr': '\n',
+    _W_NS + 'noBreakHyphen': '-',
+}
+
 
 class DocumentFormat(Enum):
     """Supported document formats."""
@@ -33,7 +63,7 @@ class DocumentFormat(Enum):
     TXT = "txt"
 
 
-@dataclass
+@dataclass(slots=True)
 class Clause:
     """Represents a contract clause with metadata."""
     number: int
@@ -49,7 +79,7 @@ class Clause:
         self.title = self.title.strip()
 
 
-@dataclass  
+@dataclass(slots=True)
 class ContractDocument:
     """Represents a parsed contract document."""
     title: str
@@ -74,12 +104,25 @@ class ContractParser:
     
     def __init__(self):
         """Initialize parser with default clause patterns."""
+        # Header patterns, matched after any leading whitespace on a line.
+        # Each captures (number, title); [^\S\n] keeps matches on one line.
         self.clause_patterns = [
-            r'^(\d+)\.\s+([^\n]+)',  # 1. Title
-            r'^Section\s+(\d+):?\s*([^\n]*)',  # Section 1: Title
-            r'^Article\s+(\d+):?\s*([^\n]*)',  # Article 1: Title
-            r'^([a-zA-Z])\.\s+([^\n]+)',  # a. Title
-            r'^\(([a-zA-Z0-9]+)\)\s+([^\n]*)',  # (a) Title
+            r'(\d+)\.[^\S\n]+(\S[^\n]*)',  # 1. Title
+            r'Section[^\S\n]+(\d+):?[^\S\n]*([^\n]*)',  # Section 1: Title
+            r'Article[^\S\n]+(\d+):?[^\S\n]*([^\n]*)',  # Article 1: Title
+            r'([a-zA-Z])\.[^\S\n]+(\S[^\n]*)',  # a. Title
+            r'\(([a-zA-Z0-9]+)\)[^\S\n]+(\S[^\n]*)',  # (a) Title
+        ]
+        # All patterns as one multiline alternation, in priority order, with
+        # each wrapped in a named group so the matching pattern is known
+        self._header_re = re.compile(
+            r'^[^\S\n]*(?:' + '|'.join(
+                f'(?P<p{index}>{pattern})' for index, pattern in enumerate(self.clause_patterns)
+            ) + ')',
+            re.IGNORECASE | re.MULTILINE
+        )
+        self._section_patterns = [
+            'Section' in pattern or 'Article' in pattern for pattern in self.clause_patterns
         ]
         
     def parse_document(self, file_path: Path) -> ContractDocument:
@@ -131,12 +174,12 @@ class ContractParser:
         suffix = file_path.suffix.lower()
         
         if suffix == '.pdf':
-            if not PyPDF2:
-                raise ImportError("PyPDF2 required for PDF parsing. Install with: pip install PyPDF2")
+            if not (pdfium or PyPDF2):
+                raise ImportError("pypdfium2 or PyPDF2 required for PDF parsing. Install with: pip install pypdfium2")
             return DocumentFormat.PDF
         elif suffix in ['.docx', '.doc']:
-            if not Document:
-                raise ImportError("python-docx required for DOCX parsing. Install with: pip install python-docx")
+            if not etree:
+                raise ImportError("lxml required for DOCX parsing. Install with: pip install lxml")
             return DocumentFormat.DOCX
         elif suffix == '.txt':
             return DocumentFormat.TXT
@@ -144,35 +187,104 @@ class ContractParser:
             raise ValueError(f"Unsupported file format: {suffix}")
     
     def _parse_pdf(self, file_path: Path) -> str:
-        """Extract text from PDF file."""
-        text = ""
+        """Extract text from PDF file, using PDFium when pypdfium2 is installed."""
+        if pdfium:
+            return self._parse_pdf_pdfium(file_path)
+        
+        parts = []
         try:
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
                 for page_num, page in enumerate(pdf_reader.pages):
                     page_text = page.extract_text()
-                    text += f"\\n[PAGE {page_num + 1}]\\n{page_text}"
+                    parts.append(f"\n[PAGE {page_num + 1}]\n{page_text}")
         except Exception as e:
             logger.error(f"Error parsing PDF {file_path}: {e}")
             raise
             
-        return text
+        return "".join(parts)
     
-    def _parse_docx(self, file_path: Path) -> str:
-        """Extract text from DOCX file."""
+    def _parse_pdf_pdfium(self, file_path: Path) -> str:
+        """Extract text from PDF file with PDFium's native text extraction."""
+        parts = []
         try:
-            doc = Document(file_path)
-            paragraphs = []
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                for page_num in range(len(pdf)):
+                    page = pdf[page_num]
+                    textpage = page.get_textpage()
+                    parts.append(f"\n[PAGE {page_num + 1}]\n{textpage.get_text_range()}")
+                    textpage.close()
+                    page.close()
+            finally:
+                pdf.close()
+        except Exception as e:
+            logger.error(f"Error parsing PDF {file_path}: {e}")
+            raise
             
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    paragraphs.append(paragraph.text.strip())
+        return "".join(parts)
+    
+    def _parse_docx(self, file_path: Path) -> str:
+        """Extract body paragraph text from DOCX file, streaming word/document.xml."""
+        body_tag = _W_NS + 'body'
+        paragraphs = []
+        try:
+            with zipfile.ZipFile(file_path) as archive, archive.open('word/document.xml') as xml_file:
+                # Uploaded documents are untrusted: never expand entities or fetch DTDs
+                events = etree.iterparse(
+                    xml_file, tag=_W_NS + 'p',
+                    resolve_entities=False, no_network=True, huge_tree=False
+                )
+                for _, element in events:
+                    parent = element.getparent()
+                    # Paragraphs nested in tables and text boxes are not body text
+                    if parent.tag != body_tag:
+                        continue
                     
-            return "\\n".join(paragraphs)
+                    text = self._docx_paragraph_text(element).strip()
+                    if text:
+                        paragraphs.append(text)
+                    
+                    # Free the parsed paragraph and everything before it
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del parent[0]
+                    
+            return "\n".join(paragraphs)
         except Exception as e:
             logger.error(f"Error parsing DOCX {file_path}: {e}")
             raise
     
+    def _docx_paragraph_text(self, paragraph) -> str:
+        """Join the text of a w:p element's runs, including runs inside hyperlinks."""
+        run_tag = _W_NS + 'r'
+        hyperlink_tag = _W_NS + 'hyperlink'
+        text_tag = _W_NS + 't'
+        break_tag = _W_NS + 'br'
+        type_attr = _W_NS + 'type'
+        
+        parts = []
+        for child in paragraph:
+            if child.tag == run_tag:
+                runs = (child,)
+            elif child.tag == hyperlink_tag:
+                runs = child.iterchildren(run_tag)
+            else:
+                continue
+            
+            for run in runs:
+                for item in run:
+                    if item.tag == text_tag:
+                        parts.append(item.text or '')
+                    elif item.tag == break_tag:
+                        # Page and column breaks carry no text
+                        if item.get(type_attr, 'textWrapping') == 'textWrapping':
+                            parts.append('\n')
+                    elif item.tag in _DOCX_RUN_SPECIAL_TEXT:
+                        parts.append(_DOCX_RUN_SPECIAL_TEXT[item.tag])
+        
+        return "".join(parts)
+    
     def _parse_txt(self, file_path: Path) -> str:
         """Read text from TXT file."""
         try:
@@ -187,6 +299,9 @@ class ContractParser:
         """
         Extract clauses from contract text using pattern matching.
         
+        Header lines are found in a single multiline scan; the non-blank
+        lines up to the next header form the clause content.
+        
         Args:
             text: Full contract text
             
@@ -194,85 +309,32 @@ class ContractParser:
             List of identified clauses
         """
         clauses = []
-        lines = text.split('\\n')
-        current_clause = None
-        clause_number = 0
+        headers = list(self._header_re.finditer(text))
         
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
+        for index, header in enumerate(headers):
+            end = headers[index + 1].start() if index + 1 < len(headers) else len(text)
+            
+            # Strip each line and drop blank ones, joining with single newlines
+            content = _LINE_BREAK_RE.sub('\n', text[header.end():end]).strip()
+            if not content:
                 continue
-                
-            # Check if line starts a new clause
-            clause_match = self._match_clause_header(line)
             
-            if clause_match:
-                # Save previous clause if exists
-                if current_clause and current_clause['content'].strip():
-                    clause_number += 1
-                    clauses.append(Clause(
-                        number=clause_number,
-                        title=current_clause['title'],
-                        content=current_clause['content'].strip(),
-                        section=current_clause.get('section'),
-                        char_position=(current_clause['start_pos'], i)
-                    ))
-                
-                # Start new clause
-                current_clause = {
-                    'title': clause_match['title'],
-                    'content': '',
-                    'section': clause_match.get('section'),
-                    'start_pos': i
-                }
-            else:
-                # Add to current clause content
-                if current_clause:
-                    current_clause['content'] += line + "\\n"
-        
-        # Add final clause
-        if current_clause and current_clause['content'].strip():
-            clause_number += 1
+            # Identify which header pattern matched and read its groups
+            pattern_index = int(header.lastgroup[1:])
+            group = self._header_re.groupindex[header.lastgroup]
+            number, title = header.group(group + 1, group + 2)
+            
             clauses.append(Clause(
-                number=clause_number,
-                title=current_clause['title'],
-                content=current_clause['content'].strip(),
-                section=current_clause.get('section'),
-                char_position=(current_clause['start_pos'], len(lines))
+                number=len(clauses) + 1,
+                title=title if title else f"Clause {number}",
+                content=content,
+                section=number if self._section_patterns[pattern_index] else None,
+                char_position=(header.start(), end)
             ))
         
         logger.info(f"Extracted {len(clauses)} clauses from document")
         return clauses
     
-    def _match_clause_header(self, line: str) -> Optional[Dict[str, str]]:
-        """
-        Check if line matches a clause header pattern.
-        
-        Args:
-            line: Text line to check
-            
-        Returns:
-            Dict with clause info if match found, None otherwise
-        """
-        for pattern in self.clause_patterns:
-            match = re.match(pattern, line, re.IGNORECASE)
-            if match:
-                groups = match.groups()
-                
-                if len(groups) >= 2:
-                    return {
-                        'number': groups[0],
-                        'title': groups[1] if groups[1] else f"Clause {groups[0]}",
-                        'section': groups[0] if 'Section' in pattern or 'Article' in pattern else None
-                    }
-                else:
-                    return {
-                        'number': groups[0] if groups else '1',
-                        'title': line,
-                        'section': None
-                    }
-        return None
-    
     def _extract_metadata(self, text: str, file_path: Path) -> Dict[str, str]:
         """
         Extract metadata from contract text.
@@ -291,24 +353,18 @@ class ContractParser:
         }
         
         # Try to extract title from first few lines
-        lines = text.split('\\n')[:10]
+        lines = text.split('\n')[:10]
         for line in lines:
             line = line.strip()
             if len(line) > 10 and len(line) < 200:
                 # Likely a title
-                if any(word in line.upper() for word in ['AGREEMENT', 'CONTRACT', 'SERVICE']):
+                if _TITLE_KEYWORD_RE.search(line):
                     metadata['title'] = line
                     break
         
         # Extract parties (basic pattern matching)
-        party_patterns = [
-            r'between\\s+([^\\n]+?)\\s+and\\s+([^\\n]+?)(?:\\.|,|\\n)',
-            r'Party\\s+A[:\s]+([^\\n]+)',
-            r'Party\\s+B[:\s]+([^\\n]+)'
-        ]
-        
-        for pattern in party_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _PARTY_PATTERNS:
+            matches = pattern.findall(text)
             if matches:
                 if isinstance(matches[0], tuple):
                     metadata['party_1'] = matches[0][0].strip()
@@ -335,7 +391,7 @@ def main():
             print(f"Content length: {contract.total_content_length}")
             
             for clause in contract.clauses[:3]:  # Show first 3 clauses
-                print(f"\\n{clause.number}. {clause.title}")
+                print(f"\n{clause.number}. {clause.title}")
                 print(f"Content preview: {clause.content[:100]}...")
                 
         except Exception as e:
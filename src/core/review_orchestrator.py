@@ -290,9 +290,8 @@ class ClauseAnalysisStage(ProcessingStage):
         if not context.contract_document:
             return
             
-        # Analyze each clause
-        for clause in context.contract_document.clauses:
-            analysis = self.analyzer.analyze_clause(clause)
+        # Analyze all clauses in one batch
+        for analysis in self.analyzer.analyze_clauses(context.contract_document.clauses):
             context.clause_analyses.append(analysis)
             context.total_tokens += analysis.token_count
     
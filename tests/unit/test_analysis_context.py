@@ -0,0 +1,49 @@
+"""
+Unit tests for AnalysisContext.
+"""
+import pytest
+from pathlib import Path
+
+from src.core.analysis_context import AnalysisContext
+from src.core.clause_analyzer import ClauseAnalysis, RiskLevel
+from src.core.contract_parser import Clause, ContractDocument, DocumentFormat
+
+
+class TestAnalysisContext:
+    """Test suite for AnalysisContext."""
+
+    @pytest.fixture
+    def context(self):
+        """Create a context with parsed clauses of mixed risk levels."""
+        clauses = [Clause(number=i, title=f"Clause {i}", content="Content") for i in range(1, 5)]
+        levels = [RiskLevel.CRITICAL, RiskLevel.MATERIAL, RiskLevel.CRITICAL, RiskLevel.PROCEDURAL]
+
+        context = AnalysisContext(source_file=Path("contract.txt"))
+        context.contract_document = ContractDocument(
+            title="Contract", clauses=clauses, metadata={},
+            source_file=Path("contract.txt"), format=DocumentFormat.TXT
+        )
+        context.clause_analyses = [
+            ClauseAnalysis(clause=clause, risk_level=level) for clause, level in zip(clauses, levels)
+        ]
+        return context
+
+    def test_get_summary_counts_risk_levels(self, context):
+        """Test summary issue counts per risk level."""
+        summary = context.get_summary()
+
+        assert summary["total_clauses"] == 4
+        assert summary["critical_issues"] == 2
+        assert summary["material_issues"] == 1
+        assert summary["procedural_issues"] == 1
+
+    def test_get_summary_without_document(self):
+        """Test summary reports an error before parsing."""
+        summary = AnalysisContext(source_file=Path("contract.txt")).get_summary()
+
+        assert summary["status"] == "error"
+
+    def test_unknown_attributes_rejected(self, context):
+        """Test the slotted context rejects attributes outside its fields."""
+        with pytest.raises(AttributeError):
+            context.clause_count = 4
@@ -1,6 +1,7 @@
 """
 Unit tests for ClauseAnalyzer component.
 """
+import re
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -297,3 +298,97 @@ class TestClauseAnalysis:
             risk_score=10.0  # Maximum score
         )
         assert analysis.risk_score == 10.0
+
+
+class TestClauseTagClassification:
+    """Test suite for ClauseAnalyzer tag classification."""
+
+    @pytest.fixture
+    def analyzer(self):
+        """Create analyzer instance with the built-in tag patterns."""
+        return ClauseAnalyzer()
+
+    def _tags(self, analyzer, title, content):
+        """Classify a clause built from title and content."""
+        return analyzer._classify_clause_tags(Clause(number=1, title=title, content=content))
+
+    def test_keywords_match_case_insensitively(self, analyzer):
+        """Test mixed-case keywords match in title and content."""
+        assert self._tags(analyzer, "Service Levels", "Provider guarantees 99.9% uptime under the sla.") == ('TEC',)
+        assert self._tags(analyzer, "GDPR", "Data is processed lawfully.") == ('COM',)
+
+    def test_multiple_tags_in_pattern_order(self, analyzer):
+        """Test every matching tag is reported in tag pattern order."""
+        tags = self._tags(analyzer, "Termination", "Either party may terminate for breach of payment terms.")
+
+        assert tags == ('LEG', 'FIN', 'TRM')
+
+    def test_regex_patterns(self, analyzer):
+        """Test regex tag patterns are matched case-insensitively."""
+        analyzer.tag_patterns = {'TEC': [re.compile(r'\bapi\b')]}
+
+        assert self._tags(analyzer, "Integration", "Access is provided via the API.") == ('TEC',)
+        assert self._tags(analyzer, "Integration", "Rapid access is provided.") == ('DOC',)
+
+    def test_reassigned_tag_patterns_are_applied(self, analyzer):
+        """Test new tag patterns take effect, including for clauses analyzed before."""
+        clause = Clause(number=1, title="Integration", content="Access is provided via the API.")
+        assert analyzer.analyze_clause(clause).tags == ('DOC',)
+
+        analyzer.tag_patterns = {'EXT': ['api']}
+
+        assert self._tags(analyzer, "Integration", "Access is provided via the API.") == ('EXT',)
+        assert analyzer.analyze_clause(clause).tags == ('EXT',)
+
+    def test_tag_patterns_edited_in_place_are_applied(self, analyzer):
+        """Test in-place pattern edits take effect and invalidate cached analyses."""
+        clause = Clause(number=1, title="Integration", content="Access is provided via the API.")
+        assert analyzer.analyze_clause(clause).tags == ('DOC',)
+
+        analyzer.tag_patterns['EXT'].append('api')
+
+        assert analyzer.analyze_clause(clause).tags == ('EXT',)
+        assert analyzer.analyze_clauses([clause])[0].tags == ('EXT',)
+
+        analyzer.tag_patterns['EXT'].remove('api')
+        assert self._tags(analyzer, "Integration", "Access is provided via the API.") == ('DOC',)
+
+    def test_default_tag(self, analyzer):
+        """Test clauses matching no pattern fall back to DOC."""
+        assert self._tags(analyzer, "Miscellaneous", "Headings are for convenience only.") == ('DOC',)
+
+
+class TestClauseAnalyzerBatch:
+    """Test suite for batch clause analysis."""
+
+    def test_analyze_clauses_matches_single(self):
+        """Test batch analysis matches per-clause analysis and session tracking."""
+        clauses = [
+            Clause(number=1, title="Fees", content="Late payment incurs a 10% penalty per week."),
+            Clause(number=2, title="Liability", content="Provider liability for any breach is unlimited."),
+            Clause(number=3, title="Notices", content="Notices are sent by email."),
+        ]
+        single, batch = ClauseAnalyzer(), ClauseAnalyzer()
+
+        assert batch.analyze_clauses(clauses) == [single.analyze_clause(clause) for clause in clauses]
+        assert batch.session == single.session
+        assert batch.session.processed_clauses == 3
+
+    def test_repeated_clauses_reuse_cached_analysis(self):
+        """Test identical clauses are analyzed once but tracked and returned separately."""
+        analyzer = ClauseAnalyzer()
+        first = analyzer.analyze_clause(
+            Clause(number=1, title="Fees", content="Late payment incurs a 10% penalty per week.")
+        )
+        first.risk_factors.append('Changed')
+
+        second, third = analyzer.analyze_clauses([
+            Clause(number=7, title="Fees", content="Late payment incurs a 10% penalty per week."),
+            Clause(number=8, title="Charges", content="Late payment incurs a 10% penalty per week."),
+        ])
+
+        assert len(analyzer._analysis_cache) == 2
+        assert second.clause.number == 7
+        assert second.tags == first.tags == ('FIN',)
+        assert second.risk_factors == first.risk_factors[:-1]
+        assert analyzer.session.processed_clauses == 3
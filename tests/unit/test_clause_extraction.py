@@ -0,0 +1,147 @@
+"""
+Unit tests for ContractParser clause and metadata extraction.
+"""
+import random
+import re
+
+import pytest
+
+from src.core.contract_parser import ContractParser
+
+
+def reference_clauses(parser, text):
+    """Extract (title, content, section) line by line, as a plain reading of the header rules."""
+    clauses = []
+    current = None
+    for line in text.split('\n'):
+        line = line.strip()
+        for index, pattern in enumerate(parser.clause_patterns):
+            header = re.match(pattern, line, re.IGNORECASE)
+            if header:
+                number, title = header.group(1), header.group(2).strip()
+                current = (
+                    title or f"Clause {number}",
+                    [],
+                    number if parser._section_patterns[index] else None
+                )
+                clauses.append(current)
+                break
+        else:
+            if current and line:
+                current[1].append(line)
+    return [(title, '\n'.join(lines), section) for title, lines, section in clauses if lines]
+
+
+class TestExtractClauses:
+    """Test suite for ContractParser._extract_clauses."""
+
+    @pytest.fixture
+    def parser(self):
+        """Create parser instance."""
+        return ContractParser()
+
+    def test_numbered_clauses_with_indentation(self, parser):
+        """Test indented headers and body lines are recognized and stripped."""
+        clauses = parser._extract_clauses(
+            "SERVICE AGREEMENT\n"
+            "  1. SCOPE OF SERVICES\n"
+            "     The Provider shall provide services.   \n"
+            "\n"
+            "     Services start on signature.\n"
+            "\t2. PAYMENT TERMS\n"
+            "   Client shall pay monthly.\n"
+        )
+
+        assert [(clause.number, clause.title, clause.content) for clause in clauses] == [
+            (1, "SCOPE OF SERVICES", "The Provider shall provide services.\nServices start on signature."),
+            (2, "PAYMENT TERMS", "Client shall pay monthly."),
+        ]
+        assert all(clause.section is None for clause in clauses)
+
+    def test_crlf_line_endings(self, parser):
+        """Test Windows line endings do not leak into titles or content."""
+        clauses = parser._extract_clauses("1. Fees\r\nFees are due.\r\n\r\n2. Term\r\nOne year.\r\n")
+
+        assert [(clause.title, clause.content) for clause in clauses] == [
+            ("Fees", "Fees are due."),
+            ("Term", "One year."),
+        ]
+
+    def test_section_and_article_headers_set_section(self, parser):
+        """Test Section/Article headers record their number and default a missing title."""
+        clauses = parser._extract_clauses(
+            "Section 4: Confidentiality\nKeep it secret.\n"
+            "ARTICLE 7\nDisputes go to arbitration.\n"
+            "a. Notices\nBy email.\n"
+        )
+
+        assert [(clause.title, clause.section) for clause in clauses] == [
+            ("Confidentiality", "4"),
+            ("Clause 7", "7"),
+            ("Notices", None),
+        ]
+
+    def test_header_only_clauses_dropped(self, parser):
+        """Test headers with no body text produce no clause and do not consume numbers."""
+        clauses = parser._extract_clauses("1. Definitions\n   \n2. Scope\nWork is defined.\n3. Empty\n")
+
+        assert [(clause.number, clause.title) for clause in clauses] == [(1, "Scope")]
+
+    def test_char_position_is_character_offsets(self, parser):
+        """Test char_position spans the header through the end of the clause text."""
+        text = "Préambule – café\n  1. Fees\nFees are due.\n2. Term\nOne year."
+        first, second = parser._extract_clauses(text)
+
+        assert first.char_position == (text.index("  1. Fees"), text.index("2. Term"))
+        assert text[slice(*second.char_position)] == "2. Term\nOne year."
+
+    def test_matches_line_by_line_reading(self, parser):
+        """Test the multiline scan agrees with a line-by-line reading on random documents."""
+        rng = random.Random(7)
+        lines = [
+            "1. Scope", "12.  Fees  ", "Section 3: Term", "section 9", "Article 2 Law",
+            "b. Notices", "(iv) Audit", "(a)", "1.", "a.Fees", "Payment is due.",
+            "   indented text   ", "", "   ", "\t", "No. 5 is not a header", "x. y",
+        ]
+        for _ in range(300):
+            separator = rng.choice(["\n", "\r\n"])
+            text = separator.join(
+                rng.choice(["", " ", "  \t"]) + rng.choice(lines) for _ in range(rng.randint(0, 25))
+            )
+
+            assert [
+                (clause.title, clause.content, clause.section)
+                for clause in parser._extract_clauses(text)
+            ] == reference_clauses(parser, text)
+
+
+class TestExtractMetadata:
+    """Test suite for ContractParser._extract_metadata."""
+
+    def test_title_and_parties(self, tmp_path):
+        """Test the title line and both parties are read across real line breaks."""
+        path = tmp_path / "contract.txt"
+        path.write_bytes(
+            b"\r\n  MASTER SERVICE AGREEMENT  \r\n"
+            b"This Agreement is made between ABC Corporation and XYZ Services Ltd.\r\n"
+            b"1. Scope\r\nServices.\r\n"
+        )
+        parser = ContractParser()
+
+        document = parser.parse_document(path)
+
+        assert document.title == "MASTER SERVICE AGREEMENT"
+        assert document.metadata['party_1'] == "ABC Corporation"
+        assert document.metadata['party_2'] == "XYZ Services Ltd"
+        assert [(clause.title, clause.content) for clause in document.clauses] == [("Scope", "Services.")]
+
+    def test_party_labels(self, tmp_path):
+        """Test labelled parties stop at the end of their line."""
+        text = "Consulting terms\nParty A: Acme Inc\nParty B: Beta LLC\n"
+        path = tmp_path / "contract.txt"
+        path.write_text(text)
+
+        metadata = ContractParser()._extract_metadata(text, path)
+
+        assert metadata['party'] == "Acme Inc"
+        assert 'title' not in metadata
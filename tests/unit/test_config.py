@@ -0,0 +1,137 @@
+"""
+Unit tests for configuration loading.
+"""
+import os
+import shutil
+import pytest
+from pathlib import Path
+
+from src import config
+
+
+CONFIG_DIR = Path(config.__file__).parent
+
+
+class TestLoadYamlFile:
+    """Test suite for load_yaml_file."""
+
+    @pytest.fixture
+    def yaml_file(self, tmp_path):
+        """Create a small YAML file."""
+        path = tmp_path / "settings.yaml"
+        path.write_text("tags:\n  TEC: Technical\n")
+        return path
+
+    def test_returns_independent_copies(self, yaml_file):
+        """Test cached data cannot be mutated through a returned value."""
+        first = config.load_yaml_file(yaml_file)
+        first["tags"]["TEC"] = "Changed"
+
+        assert config.load_yaml_file(yaml_file) == {"tags": {"TEC": "Technical"}}
+
+    def test_reloads_modified_file(self, yaml_file):
+        """Test a file is parsed again once its mtime or size changes."""
+        assert config.load_yaml_file(yaml_file) == {"tags": {"TEC": "Technical"}}
+
+        yaml_file.write_text("tags:\n  LEG: Legal\n")
+        stat = yaml_file.stat()
+        os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert config.load_yaml_file(yaml_file) == {"tags": {"LEG": "Legal"}}
+
+    def test_missing_file(self, tmp_path):
+        """Test a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            config.load_yaml_file(tmp_path / "missing.yaml")
+
+    def test_invalid_yaml(self, tmp_path):
+        """Test malformed YAML raises ValueError."""
+        path = tmp_path / "broken.yaml"
+        path.write_text("tags: [unclosed\n")
+
+        with pytest.raises(ValueError):
+            config.load_yaml_file(path)
+
+
+class TestLoadConfig:
+    """Test suite for load_config."""
+
+    @pytest.fixture
+    def config_dir(self, tmp_path):
+        """Copy the shipped configuration files into a temporary directory."""
+        for name in ("blueprint.yaml", "clause_definitions.yaml", "review_templates.yaml"):
+            shutil.copy(CONFIG_DIR / name, tmp_path / name)
+        return tmp_path
+
+    def test_cached_config_is_independent_copy(self, config_dir):
+        """Test repeated loads return equal but unshared configurations."""
+        first = config.load_config(str(config_dir))
+        first["clause_tagging_system"]["tags"].clear()
+
+        second = config.load_config(str(config_dir))
+        assert second["clause_tagging_system"]["tags"]
+        assert second == config.load_config(str(CONFIG_DIR))
+
+    def test_config_revalidated_when_file_changes(self, config_dir):
+        """Test an edited config file is picked up and validated."""
+        config.load_config(str(config_dir))
+
+        (config_dir / "review_templates.yaml").write_text("report_templates:\n  brief: {}\n")
+
+        assert config.load_config(str(config_dir))["report_templates"] == {"brief": {}}
+
+    def test_blueprint_only_skips_other_files(self, config_dir):
+        """Test a blueprint-only load ignores the definition and template files."""
+        (config_dir / "review_templates.yaml").write_text("report_templates: [unclosed\n")
+
+        blueprint = config.load_config(str(config_dir), blueprint_only=True)
+
+        assert set(blueprint) == {
+            "neex_legal_contract_review_blueprint", "clause_tagging_system",
+            "modular_clause_checklist", "executional_flow",
+        }
+        with pytest.raises(ValueError):
+            config.load_config(str(config_dir))
+
+    def test_missing_clause_tags_reported(self, config_dir):
+        """Test validation names only the clause tags that are missing."""
+        blueprint_path = config_dir / "blueprint.yaml"
+        blueprint_path.write_text(
+            blueprint_path.read_text().replace('  TEC: "', '  XTEC: "').replace('  EXT: "', '  XEXT: "')
+        )
+
+        with pytest.raises(ValueError, match=r"Missing required clause tags: \['EXT', 'TEC'\]"):
+            config.load_config(str(config_dir), blueprint_only=True)
+
+
+class TestGetEnvConfig:
+    """Test suite for get_env_config."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Parse the environment afresh around each test."""
+        config.get_env_config.cache_clear()
+        yield
+        config.get_env_config.cache_clear()
+
+    def test_parses_environment_once(self, monkeypatch):
+        """Test values are typed and cached until cache_clear is called."""
+        monkeypatch.setenv("NEEX_DEBUG", "TRUE")
+        monkeypatch.setenv("NEEX_MAX_CLAUSE_TOKENS", "1500")
+
+        env = config.get_env_config()
+        assert env["debug"] is True
+        assert env["max_clause_tokens"] == 1500
+
+        monkeypatch.setenv("NEEX_MAX_CLAUSE_TOKENS", "2500")
+        assert config.get_env_config()["max_clause_tokens"] == 1500
+
+        config.get_env_config.cache_clear()
+        assert config.get_env_config()["max_clause_tokens"] == 2500
+
+    def test_returns_independent_copies(self, monkeypatch):
+        """Test callers cannot modify the cached environment configuration."""
+        monkeypatch.delenv("NEEX_LOG_LEVEL", raising=False)
+        config.get_env_config()["log_level"] = "DEBUG"
+
+        assert config.get_env_config()["log_level"] == "INFO"
@@ -0,0 +1,62 @@
+"""
+Unit tests for ContractParser DOCX text extraction.
+"""
+import zipfile
+
+import pytest
+
+from src.core.contract_parser import ContractParser
+
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def write_docx(path, body, doctype=""):
+    """Write a minimal DOCX archive whose document body is the given WordprocessingML."""
+    document = (
+        f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>{doctype}'
+        f'<w:document xmlns:w="{W_NS}"><w:body>{body}</w:body></w:document>'
+    )
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("word/document.xml", document)
+    return path
+
+
+class TestParseDocx:
+    """Test suite for ContractParser._parse_docx."""
+
+    @pytest.fixture
+    def parser(self):
+        """Create parser instance."""
+        return ContractParser()
+
+    def test_body_paragraphs_and_runs(self, parser, tmp_path):
+        """Test runs are joined per body paragraph, with tabs and breaks mapped to text."""
+        path = write_docx(tmp_path / "contract.docx", (
+            '<w:p><w:r><w:t>SERVICE </w:t></w:r><w:r><w:t>AGREEMENT</w:t></w:r></w:p>'
+            '<w:p><w:r><w:t xml:space="preserve">   </w:t></w:r></w:p>'
+            '<w:p><w:r><w:t>1.</w:t><w:tab/><w:t>Terms</w:t></w:r></w:p>'
+            '<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Table cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>'
+            '<w:p><w:r><w:t>Fees</w:t><w:br/><w:t>are due</w:t><w:br w:type="page"/></w:r>'
+            '<w:hyperlink><w:r><w:t> online</w:t></w:r></w:hyperlink></w:p>'
+        ))
+
+        assert parser._parse_docx(path) == "SERVICE AGREEMENT\n1.\tTerms\nFees\nare due online"
+
+    def test_entities_not_expanded(self, parser, tmp_path):
+        """Test external and internal entities in document.xml are never resolved."""
+        secret = tmp_path / "secret.txt"
+        secret.write_text("TOP SECRET")
+        doctype = (
+            f'<!DOCTYPE w:document [<!ENTITY xxe SYSTEM "{secret.as_uri()}">'
+            '<!ENTITY greeting "Hello">]>'
+        )
+        path = write_docx(tmp_path / "contract.docx", (
+            '<w:p><w:r><w:t>Before &xxe; after</w:t></w:r></w:p>'
+            '<w:p><w:r><w:t>&greeting;</w:t></w:r></w:p>'
+        ), doctype)
+
+        text = parser._parse_docx(path)
+
+        assert "TOP SECRET" not in text
+        assert "Hello" not in text
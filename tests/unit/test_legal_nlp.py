@@ -0,0 +1,165 @@
+"""
+Unit tests for LegalNLPProcessor component.
+"""
+import pytest
+
+from src.ai.legal_nlp import LegalNLPProcessor
+
+
+class TestLegalNLPProcessor:
+    """Test suite for LegalNLPProcessor."""
+
+    @pytest.fixture
+    def processor(self):
+        """Create processor instance."""
+        return LegalNLPProcessor()
+
+    @pytest.fixture
+    def sample_text(self):
+        """Sample clause text with obligations, deadlines and financial terms."""
+        return (
+            "The Provider shall deliver all deliverables within 30 days of contract execution. "
+            "If the Provider fails to meet the deadline, a penalty of 2% per month shall apply. "
+            "The Client must pay all invoices within 15 days of receipt."
+        )
+
+    def test_clean_text_collapses_whitespace(self, processor):
+        """Test that line breaks and repeated whitespace are collapsed."""
+        assert processor._clean_text("  Payment\n\n is   due\r\nnow ") == "Payment is due now"
+
+    def test_clean_text_normalizes_quotes(self, processor):
+        """Test that typographic quotes become straight quotes."""
+        assert processor._clean_text("\u201cServices\u201d and the Client\u2019s data") == \
+            "\"Services\" and the Client's data"
+
+    def test_extract_key_terms(self, processor, sample_text):
+        """Test key term extraction picks up financial and temporal terms."""
+        terms = processor.extract_key_terms(sample_text, ['TEC', 'FIN'])
+
+        assert 'penalty' in terms
+        assert '2%' in terms
+        assert 'within 30 days' in terms
+        assert len(terms) <= 10
+
+    def test_extract_key_terms_legal_vocabulary(self, processor):
+        """Test legal words and phrases are recognized."""
+        terms = processor.extract_key_terms(
+            "This Agreement is subject to the governing law of Delaware. Any breach is excluded.",
+            ['LEG']
+        )
+
+        assert 'governing law' in terms
+        assert 'breach' in terms
+
+    def test_extract_key_terms_overlapping_categories(self, processor):
+        """Test overlapping financial and temporal terms are all reported."""
+        texts = [
+            "Refund is due upon payment of the fee.",
+            "Client shall pay within 30 days after invoice.",
+        ]
+
+        for terms in ([processor.extract_key_terms(text) for text in texts],
+                      processor.extract_key_terms_batch(texts)):
+            assert {'payment', 'upon payment'} <= set(terms[0])
+            assert {'30 days after', '30 days', 'within 30 days'} <= set(terms[1])
+
+    def test_extract_key_terms_batch_matches_single(self, processor, sample_text):
+        """Test batch extraction returns per-clause results in input order."""
+        texts = [sample_text, "Uptime must be maintained.", "", "Any breach is excluded."]
+        tags = [['TEC', 'FIN'], ['TEC'], None, ['LEG']]
+
+        assert processor.extract_key_terms_batch(texts, tags) == [
+            processor.extract_key_terms(text, text_tags) for text, text_tags in zip(texts, tags)
+        ]
+
+    def test_extract_key_terms_batch_tag_count_mismatch(self, processor):
+        """Test batch extraction rejects misaligned context tags."""
+        with pytest.raises(ValueError):
+            processor.extract_key_terms_batch(["a", "b"], [['TEC']])
+
+    def test_technical_terms_require_tec_tag(self, processor):
+        """Test technical terms are only reported for TEC clauses."""
+        text = "Uptime must be maintained."
+
+        assert 'Uptime' in processor.extract_key_terms(text, ['TEC'])
+        assert 'Uptime' not in processor.extract_key_terms(text, ['LEG'])
+
+    def test_extract_obligations(self, processor, sample_text):
+        """Test obligation extraction with types and actions."""
+        obligations = processor.extract_obligations(sample_text)
+
+        types = [obligation['type'] for obligation in obligations]
+        assert 'delivery_obligation' in types
+        assert 'payment_obligation' in types
+        assert all(obligation['action'] in ('deliver', 'pay') for obligation in obligations)
+
+    def test_extract_obligations_overlapping_spans_reported_once(self, processor):
+        """Test an obligation nested inside another match is not double counted."""
+        obligations = processor.extract_obligations("Any payment you must pay is due monthly.")
+
+        assert [obligation['type'] for obligation in obligations] == ['payment_obligation']
+        assert obligations[0]['text'] == "payment you must pay is due"
+
+    def test_identify_obligated_party(self, processor):
+        """Test party identification from obligation text."""
+        assert processor._identify_obligated_party("The Vendor shall pay") == "Provider"
+        assert processor._identify_obligated_party("Customer must inform") == "Client"
+        assert processor._identify_obligated_party("Each party shall notify") == "Both"
+        assert processor._identify_obligated_party("shall pay") == "Unspecified"
+
+    def test_extract_conditions(self, processor):
+        """Test conditional statement extraction."""
+        conditions = processor.extract_conditions(
+            "If payment is late then interest accrues. Unless agreed otherwise, fees apply."
+        )
+
+        types = [condition['type'] for condition in conditions]
+        assert 'conditional' in types
+        assert any(condition['trigger'].strip() == 'payment is late' for condition in conditions)
+
+    def test_extract_temporal_elements(self, processor, sample_text):
+        """Test temporal elements are normalized with sentence context."""
+        elements = processor.extract_temporal_elements(sample_text)
+        durations = [element for element in elements if element['type'] == 'duration']
+
+        assert [element['value'] for element in durations] == ['30 days', '15 days']
+        assert durations[1]['context'] == "The Client must pay all invoices within 15 days of receipt"
+
+    def test_cached_results_are_independent_copies(self, processor, sample_text):
+        """Test repeated calls hit the cache without sharing mutable results."""
+        first = processor.extract_obligations(sample_text)
+        first[0]['party'] = 'Changed'
+        first.clear()
+
+        second = processor.extract_obligations(sample_text)
+        assert second == LegalNLPProcessor().extract_obligations(sample_text)
+        assert second and second[0]['party'] != 'Changed'
+
+    def test_analyze_clause_function(self, processor):
+        """Test clause function identification."""
+        function = processor._identify_clause_function(
+            "The Client shall pay each invoice. Payment of the fee and any penalty is due."
+        )
+
+        assert function.primary_function == 'govern payments'
+        assert 'define obligations' in function.secondary_functions
+
+    def test_analyze_clause_function_no_indicators(self, processor):
+        """Test fallback when no function indicators are present."""
+        function = processor._identify_clause_function("Lorem ipsum dolor.")
+
+        assert function.primary_function == "establish contractual terms"
+        assert function.confidence == 0.3
+
+    def test_shared_vocabularies_are_read_only(self, processor):
+        """Test instances cannot alter the vocabularies and patterns shared by all processors."""
+        with pytest.raises(TypeError):
+            processor.function_indicators['govern_payments'] = ('invoice',)
+        with pytest.raises(TypeError):
+            processor.temporal_patterns['deadline'] = None
+        with pytest.raises(TypeError):
+            processor.legal_vocabulary['words'] += ('estoppel',)
+
+        assert LegalNLPProcessor()._identify_clause_function("The fee is due.").primary_function == \
+            'govern payments'
+
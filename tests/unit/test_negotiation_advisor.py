@@ -4,9 +4,11 @@ Unit tests for NegotiationAdvisor component.
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
-from src.ai.negotiation_advisor import NegotiationAdvisor, NegotiationRecommendation
+from src.ai.negotiation_advisor import (
+    CompiledRule, NegotiationAdvisor, NegotiationRecommendation, NegotiationRule
+)
 from src.core.analysis_context import AnalysisContext
-from src.core.clause_analyzer import ClauseAnalysis
+from src.core.clause_analyzer import ClauseAnalysis, RiskLevel
 
 
 class TestNegotiationAdvisor:
@@ -409,3 +411,124 @@ class TestNegotiationRecommendation:
         assert rec_dict["suggested_change"] == "Change this"
         assert rec_dict["rationale"] == "Risk mitigation"
         assert rec_dict["alternative_approaches"] == ["Alt 1"]
+
+
+class TestCompiledRule:
+    """Test suite for compiled negotiation rule conditions."""
+    
+    def test_conditions_are_normalized(self):
+        """Test string conditions become tuples and keywords are lowercased."""
+        rule = NegotiationRule(
+            name="Test",
+            conditions={
+                'tags': 'LEG',
+                'content_contains': 'Liability',
+                'content_lacks': ['CAP', 'limit']
+            },
+            recommendation_template={},
+            priority='High'
+        )
+        
+        compiled = CompiledRule.from_rule(rule)
+        
+        assert compiled.rule is rule
+        assert compiled.required_risk is None
+        assert compiled.required_tags == frozenset({'LEG'})
+        assert compiled.contains == ('liability',)
+        assert compiled.lacks == ('cap', 'limit')
+    
+    def test_context_and_content_checks(self):
+        """Test scalar and content conditions are evaluated separately."""
+        compiled = CompiledRule.from_rule(NegotiationRule(
+            name="Test",
+            conditions={'risk_level': 'Critical', 'tags': ['FIN'], 'content_lacks': ['cap']},
+            recommendation_template={},
+            priority='High'
+        ))
+        
+        assert compiled.checks_content
+        assert compiled.applies_to_context(frozenset({'FIN', 'LEG'}), RiskLevel.CRITICAL)
+        assert not compiled.applies_to_context(frozenset({'FIN'}), RiskLevel.MATERIAL)
+        assert not compiled.applies_to_context(frozenset({'LEG'}), RiskLevel.CRITICAL)
+        assert compiled.applies_to_content("penalties apply")
+        assert not compiled.applies_to_content("penalties are subject to a cap")
+    
+    def test_default_rules_are_compiled(self):
+        """Test every loaded rule has compiled conditions."""
+        advisor = NegotiationAdvisor()
+        rules = advisor.rules
+        
+        assert [compiled.rule for compiled in advisor._compiled_rules] == rules
+    
+    def test_default_rules_not_shared_between_advisors(self):
+        """Test editing one advisor's default rules leaves other advisors untouched."""
+        advisor = NegotiationAdvisor()
+        advisor.rules[0].conditions['tags'] = ['TEC']
+        advisor.rules[0].recommendation_template['opportunity'] = 'Changed'
+        
+        rule = NegotiationAdvisor().rules[0]
+        assert rule.conditions['tags'] == ['FIN']
+        assert rule.recommendation_template['opportunity'] != 'Changed'
+    
+    def test_rules_load_on_first_use(self):
+        """Test rules are not loaded until they are needed."""
+        advisor = NegotiationAdvisor()
+        
+        assert advisor._rules is None
+        assert len(advisor.rules) == 5
+    
+    def test_appended_rules_are_applied(self):
+        """Test rules appended after use are compiled and bypass cached answers."""
+        advisor = NegotiationAdvisor()
+        clause = Mock(title="Payment", content="Funds are held in ESCROW.")
+        assert advisor.identify_opportunities(clause, ['FIN'], RiskLevel.PROCEDURAL) == \
+            "No specific negotiation opportunities identified for this clause."
+        
+        advisor.rules.append(NegotiationRule(
+            name="Escrow",
+            conditions={'content_contains': ['escrow']},
+            recommendation_template={'opportunity': 'Review escrow terms'},
+            priority='Low'
+        ))
+        
+        assert advisor.identify_opportunities(clause, ['FIN'], RiskLevel.PROCEDURAL) == "Review escrow terms"
+    
+    def test_replaced_rules_are_applied(self):
+        """Test swapping or reassigning rules without changing their count recompiles them."""
+        advisor = NegotiationAdvisor()
+        clause = Mock(title="Payment", content="Funds are held in ESCROW.")
+        escrow_rule = NegotiationRule(
+            name="Escrow",
+            conditions={'content_contains': ['escrow']},
+            recommendation_template={'opportunity': 'Review escrow terms'},
+            priority='Low'
+        )
+        assert advisor.identify_opportunities(clause, ['FIN'], RiskLevel.PROCEDURAL) == \
+            "No specific negotiation opportunities identified for this clause."
+        
+        advisor.rules[0] = escrow_rule
+        assert advisor.identify_opportunities(clause, ['FIN'], RiskLevel.PROCEDURAL) == "Review escrow terms"
+        
+        advisor.rules = [NegotiationRule(
+            name="Escrow release",
+            conditions={'content_contains': ['escrow']},
+            recommendation_template={'opportunity': 'Define escrow release conditions'},
+            priority='Low'
+        )]
+        assert advisor.identify_opportunities(clause, ['FIN'], RiskLevel.PROCEDURAL) == \
+            "Define escrow release conditions"
+    
+    def test_edited_rules_are_applied(self):
+        """Test in-place edits to a rule's conditions and template take effect."""
+        advisor = NegotiationAdvisor()
+        clause = Mock(title="Liability", content="Provider is liable for all losses.")
+        assert advisor.identify_opportunities(clause, ['LEG'], RiskLevel.MATERIAL) == \
+            "Unlimited liability exposure should be capped"
+        
+        advisor.rules[1].conditions['tags'] = ['TEC']
+        assert advisor.identify_opportunities(clause, ['LEG'], RiskLevel.MATERIAL) == \
+            "No specific negotiation opportunities identified for this clause."
+        
+        advisor.rules[1].conditions['tags'].append('LEG')
+        advisor.rules[1].recommendation_template['opportunity'] = 'Cap liability'
+        assert advisor.identify_opportunities(clause, ['LEG'], RiskLevel.MATERIAL) == "Cap liability"
@@ -0,0 +1,115 @@
+"""
+Unit tests for RiskAssessor component.
+"""
+import pytest
+
+from src.ai.risk_assessor import RiskAssessor
+from src.core.contract_parser import Clause
+
+
+class TestRiskAssessor:
+    """Test suite for RiskAssessor."""
+
+    @pytest.fixture
+    def assessor(self):
+        """Create assessor instance."""
+        return RiskAssessor()
+
+    def _risk_factors(self, assessor, content, tags):
+        """Assess a clause built from content and return its risk factors."""
+        score, factors = assessor.assess_risk(Clause(number=1, title="Test", content=content), tags)
+        assert 0.0 <= score <= 10.0
+        return factors
+
+    def test_high_penalty_rate_detected(self, assessor):
+        """Test penalty percentages above 5% are flagged."""
+        factors = self._risk_factors(assessor, "Late delivery incurs a 10% weekly penalty.", ['FIN'])
+
+        assert "Financial: High penalty rate of 10.0% may be excessive" in factors
+
+    def test_low_penalty_rate_not_flagged(self, assessor):
+        """Test modest penalty percentages are not flagged."""
+        factors = self._risk_factors(assessor, "Late delivery incurs a 2% weekly penalty.", ['FIN'])
+
+        assert not any("High penalty rate" in factor for factor in factors)
+
+    def test_tight_timelines_detected(self, assessor):
+        """Test timelines under three days are flagged in any unit."""
+        factors = self._risk_factors(
+            assessor, "Provider must respond within 12 hours and resolve within 2 Days.", ['TEC']
+        )
+
+        assert "Operational: Tight timeline of 2 days may be unrealistic" in factors
+        assert "Operational: Tight timeline of 12 hours may be unrealistic" in factors
+
+    def test_reasonable_timeline_not_flagged(self, assessor):
+        """Test timelines of a week or more are not flagged."""
+        factors = self._risk_factors(assessor, "Provider must respond within 1 week.", ['TEC'])
+
+        assert not any("Tight timeline" in factor for factor in factors)
+
+    def test_clause_without_keywords_runs_pattern_checks(self, assessor):
+        """Test short clauses with no risk keywords still get pattern checks."""
+        assert self._risk_factors(assessor, "ARTICLE 5 - GENERAL", ['LEG']) == []
+        assert self._risk_factors(assessor, "Within 2 days.", ['TEC']) == [
+            "Operational: Tight timeline of 2 days may be unrealistic"
+        ]
+
+    def test_keyword_rule_guards(self, assessor):
+        """Test a rule is suppressed only when its whole guard group is present."""
+        description = "Financial: Payment terms lack penalty provisions for late payment"
+
+        assert description in self._risk_factors(assessor, "Payment accrues interest.", ['FIN'])
+        assert description not in self._risk_factors(
+            assessor, "Late payment accrues interest and a penalty.", ['FIN']
+        )
+
+    def test_identify_vulnerabilities(self, assessor):
+        """Test indicator phrases and tag-specific checks are reported."""
+        vulnerabilities = assessor.identify_vulnerabilities(
+            "Client is solely responsible for all payment obligations.", ['FIN']
+        )
+
+        assert "asymmetric_terms: solely responsible" in vulnerabilities
+        assert "Financial: No escrow protection for payments" in vulnerabilities
+
+    def test_identify_vulnerabilities_ordered(self, assessor):
+        """Test vulnerabilities are reported once, indicators before tag-specific checks."""
+        vulnerabilities = assessor.identify_vulnerabilities(
+            "Goods are sold as is and the Client is solely responsible for payment.", ['FIN']
+        )
+
+        assert vulnerabilities == [
+            "asymmetric_terms: solely responsible",
+            "missing_protections: as is",
+            "Financial: No escrow protection for payments",
+        ]
+
+    def test_repeated_clauses_reuse_cached_assessment(self, assessor):
+        """Test identical clauses and tag sets share one cached assessment."""
+        content = "Client is solely responsible for payment and data handling."
+        first = self._risk_factors(assessor, content, ['FIN', 'LEG'])
+        second = self._risk_factors(assessor, content, ['LEG', 'FIN'])
+
+        assert first == second
+        assert len(assessor._assessment_cache) == 1
+
+        vulnerabilities = assessor.identify_vulnerabilities(content, ['FIN', 'LEG'])
+        vulnerabilities.clear()
+        assert assessor.identify_vulnerabilities(content, ['FIN', 'LEG']) == \
+            RiskAssessor().identify_vulnerabilities(content, ['FIN', 'LEG'])
+
+    def test_assess_risk_batch(self, assessor):
+        """Test batch assessment matches per-clause results in input order."""
+        clauses = [
+            Clause(number=1, title="Fees", content="Late delivery incurs a 10% weekly penalty."),
+            Clause(number=2, title="Support", content="Provider must respond within 12 hours."),
+        ]
+        tags_list = [['FIN'], ['TEC']]
+
+        assert assessor.assess_risk_batch(clauses, tags_list) == [
+            RiskAssessor().assess_risk(clause, tags) for clause, tags in zip(clauses, tags_list)
+        ]
+
+        with pytest.raises(ValueError):
+            assessor.assess_risk_batch(clauses, [['FIN']])